@@ -44,14 +44,16 @@ File Path:
     - network_diagnostic_tool.py (modifiable as needed)
 """
 
+import asyncio
 import platform
+import shutil
 import subprocess
 import sys
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 import socket
-import http.client
-import urllib.request
 
 class NetworkDiagnosticTool:
     """
@@ -61,17 +63,21 @@ class NetworkDiagnosticTool:
         os_type (str): A string indicating the detected operating system
                        ('Windows', 'Linux', 'Darwin', etc.).
         report_data (dict): A dictionary holding all gathered diagnostics
-                            for easy access and serialization.
+                            for easy access and serialization. Command output
+                            sections are stored as lists of lines.
         pbx_address (str): The IP or hostname of the PBX server (if known).
         phone_ips (List[str]): A list of Polycom phone IPs to query.
         phone_admin_user (str): Admin or user credential for phone web interface (if needed).
         phone_admin_pass (str): The corresponding phone password for phone web interface.
+        verbose (bool): If True, run the full 4-probe OS ping instead of the
+                        quick TCP reachability check.
     """
     def __init__(self,
                  pbx_address: Optional[str] = None,
                  phone_ips: Optional[List[str]] = None,
                  phone_admin_user: Optional[str] = None,
-                 phone_admin_pass: Optional[str] = None):
+                 phone_admin_pass: Optional[str] = None,
+                 verbose: bool = False):
         """
         Constructor for NetworkDiagnosticTool.
         Detects the operating system and initializes a data structure for storing results.
@@ -80,11 +86,11 @@ class NetworkDiagnosticTool:
         self.os_type = platform.system()  # 'Windows', 'Linux', or 'Darwin' (for macOS)
         self.report_data: Dict[str, Any] = {
             "os_type": self.os_type,
-            "ip_info": "",
-            "gateway_info": "",
-            "dns_info": "",
-            "arp_table": "",
-            "routing_table": "",
+            "ip_info": [],
+            "gateway_info": [],
+            "dns_info": [],
+            "arp_table": [],
+            "routing_table": [],
             "additional_checks": [],
             "pbx_checks": [],
             "phone_checks": []
@@ -94,11 +100,16 @@ class NetworkDiagnosticTool:
         self.phone_ips = phone_ips if phone_ips else []
         self.phone_admin_user = phone_admin_user
         self.phone_admin_pass = phone_admin_pass
+        self.verbose = verbose
+        # Resolve `ip` once; it is used by several gather methods
+        self._ip_cmd = self.which_command(("ip",))
+        # getaddrinfo() results per host, shared by all TCP/HTTP checks
+        self._addr_cache: Dict[str, list] = {}
 
     def gather_ip_info(self) -> None:
         """
         Gathers IP configuration details (IP addresses, subnet masks, etc.).
-        Updates self.report_data['ip_info'] with the command output.
+        Updates self.report_data['ip_info'] with the command output, as a list of lines.
 
         Raises:
             subprocess.CalledProcessError: if the command fails to run.
@@ -108,17 +119,17 @@ class NetworkDiagnosticTool:
                 cmd = ["ipconfig", "/all"]
             else:
                 # For Linux / macOS, prefer `ip addr`; fallback to `ifconfig`
-                ip_cmd = self.which_command(["ip"])
+                ip_cmd = self._ip_cmd
                 if ip_cmd:
                     cmd = [ip_cmd, "addr", "show"]
                 else:
                     cmd = ["ifconfig"]
 
             result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
-            self.report_data["ip_info"] = result.strip()
+            self.report_data["ip_info"] = result.splitlines()
 
         except subprocess.CalledProcessError as e:
-            self.report_data["ip_info"] = f"Error gathering IP info: {e.output}"
+            self.report_data["ip_info"] = f"Error gathering IP info: {e.output}".splitlines()
 
     def gather_gateway_info(self) -> None:
         """
@@ -129,17 +140,17 @@ class NetworkDiagnosticTool:
             if self.os_type == "Windows":
                 cmd = ["route", "print"]
             else:
-                ip_cmd = self.which_command(["ip"])
+                ip_cmd = self._ip_cmd
                 if ip_cmd:
                     cmd = [ip_cmd, "route", "show"]
                 else:
                     cmd = ["netstat", "-rn"]
 
             result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
-            self.report_data["gateway_info"] = result.strip()
+            self.report_data["gateway_info"] = result.splitlines()
 
         except subprocess.CalledProcessError as e:
-            self.report_data["gateway_info"] = f"Error gathering gateway info: {e.output}"
+            self.report_data["gateway_info"] = f"Error gathering gateway info: {e.output}".splitlines()
 
     def gather_dns_info(self) -> None:
         """
@@ -151,19 +162,18 @@ class NetworkDiagnosticTool:
             if self.os_type == "Windows":
                 cmd = ["ipconfig", "/all"]
                 result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
-                self.report_data["dns_info"] = result.strip()
+                self.report_data["dns_info"] = result.splitlines()
             else:
                 # Linux / macOS typically store DNS info in /etc/resolv.conf
                 try:
                     with open("/etc/resolv.conf", "r", encoding="utf-8") as f:
-                        resolv_data = f.read().strip()
-                    self.report_data["dns_info"] = resolv_data
+                        self.report_data["dns_info"] = f.read().splitlines()
                 except FileNotFoundError:
-                    self.report_data["dns_info"] = (
+                    self.report_data["dns_info"] = [
                         "No /etc/resolv.conf found. Unable to gather DNS info."
-                    )
+                    ]
         except subprocess.CalledProcessError as e:
-            self.report_data["dns_info"] = f"Error gathering DNS info: {e.output}"
+            self.report_data["dns_info"] = f"Error gathering DNS info: {e.output}".splitlines()
 
     def gather_arp_table(self) -> None:
         """
@@ -173,10 +183,10 @@ class NetworkDiagnosticTool:
         try:
             cmd = ["arp", "-a"]  # Works on Windows, Linux, macOS
             result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
-            self.report_data["arp_table"] = result.strip()
+            self.report_data["arp_table"] = result.splitlines()
 
         except subprocess.CalledProcessError as e:
-            self.report_data["arp_table"] = f"Error gathering ARP info: {e.output}"
+            self.report_data["arp_table"] = f"Error gathering ARP info: {e.output}".splitlines()
 
     def gather_routing_table(self) -> None:
         """
@@ -187,17 +197,17 @@ class NetworkDiagnosticTool:
             if self.os_type == "Windows":
                 cmd = ["route", "print"]
             else:
-                ip_cmd = self.which_command(["ip"])
+                ip_cmd = self._ip_cmd
                 if ip_cmd:
                     cmd = [ip_cmd, "route", "show"]
                 else:
                     cmd = ["netstat", "-rn"]
 
             result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
-            self.report_data["routing_table"] = result.strip()
+            self.report_data["routing_table"] = result.splitlines()
 
         except subprocess.CalledProcessError as e:
-            self.report_data["routing_table"] = f"Error gathering routing table: {e.output}"
+            self.report_data["routing_table"] = f"Error gathering routing table: {e.output}".splitlines()
 
     def perform_additional_checks(self) -> None:
         """
@@ -221,7 +231,8 @@ class NetworkDiagnosticTool:
     def check_pbx_connectivity(self) -> None:
         """
         If a PBX address was provided, attempts to verify connectivity 
-        using ping, and optionally, a SIP or HTTP check.
+        using a SIP and HTTP port check (plus a full ping in verbose mode).
+        The port checks run concurrently on an asyncio event loop.
         
         Populates self.report_data['pbx_checks'] with results.
         """
@@ -229,79 +240,131 @@ class NetworkDiagnosticTool:
             self.report_data["pbx_checks"].append("No PBX address provided.")
             return
 
-        checks = []
-        # 1. Ping the PBX address
-        checks.append(self._ping_test(self.pbx_address))
+        self.report_data["pbx_checks"] = asyncio.run(self._check_pbx_connectivity_async())
+
+    async def _check_pbx_connectivity_async(self) -> List[str]:
+        """
+        Async implementation of check_pbx_connectivity.
+
+        Returns:
+            List[str]: The PBX check results, in a fixed order.
+        """
+        coros = []
+        # 1. Ping the PBX address. The TCP port checks below already prove
+        #    reachability, so the slow ping only runs in verbose mode.
+        if self.verbose:
+            coros.append(asyncio.to_thread(self._ping_test, self.pbx_address))
 
         # 2. (Optional) Check if SIP port is open. For a simplistic approach,
         #    we can do a TCP connection test to port 5060 (common SIP port).
         #    This won't fully confirm SIP registration, but can show connectivity.
-        sip_port_check = self._check_tcp_port(self.pbx_address, 5060, "SIP")
-        checks.append(sip_port_check)
+        coros.append(self._async_check_tcp_port(self.pbx_address, 5060, "SIP"))
 
         # 3. (Optional) If PBX offers an HTTP/HTTPS portal, we can attempt a quick GET.
         #    e.g., check port 80 or 443. This might help confirm the PBX web UI is reachable.
         #    We'll check port 80 (HTTP) in this example. Adjust as needed.
-        http_check = self._check_tcp_port(self.pbx_address, 80, "HTTP")
-        checks.append(http_check)
+        coros.append(self._async_check_tcp_port(self.pbx_address, 80, "HTTP"))
 
         # Additional logic:
         # - If SIP port is open, we could attempt a more thorough OPTIONS or REGISTER request
         #   using a SIP library (e.g., pjsip or aiosip in Python).
         # - We keep it simple here for demonstration.
 
-        self.report_data["pbx_checks"] = checks
+        return list(await asyncio.gather(*coros))
 
-    def check_polycom_phones(self) -> None:
+    def check_polycom_phones(self, max_workers: int = 5) -> None:
         """
         Attempts to check each Polycom VVX 450 phone in self.phone_ips list.
+        Phones are checked concurrently on an asyncio event loop (at most
+        max_workers at a time), and results keep the same order as self.phone_ips.
         We'll do:
-          - Ping test
-          - (Optional) HTTP/HTTPS GET to phone's web interface 
+          - Ping test (verbose mode only; the HTTP probe proves reachability)
+          - HTTP GET to phone's web interface via _probe_phones
             (default is typically http://<phone-ip> or https://<phone-ip>).
         Stores results in self.report_data['phone_checks'].
+
+        Args:
+            max_workers (int): Maximum number of phones to check at the same time.
         """
-        phone_results = []
         if not self.phone_ips:
             self.report_data["phone_checks"].append("No phone IPs provided.")
             return
 
-        for ip in self.phone_ips:
-            msg_list = [f"Checking Polycom VVX 450 Phone @ IP: {ip}"]
+        self.report_data["phone_checks"] = asyncio.run(
+            self._check_polycom_phones_async(max_workers)
+        )
 
-            # 1. Ping Test
-            ping_result = self._ping_test(ip)
-            msg_list.append(ping_result)
+    async def _check_polycom_phones_async(self, max_workers: int) -> List[str]:
+        """
+        Async implementation of check_polycom_phones. The web interfaces are
+        swept with _probe_phones; in verbose mode the pings run alongside it.
 
-            # 2. Attempt to open phone’s web interface
-            #    Many Polycom phones default to HTTP on port 80 or HTTPS on 443.
-            #    We'll try HTTP on port 80 for demonstration.
-            port_check = self._check_tcp_port(ip, 80, "Polycom Web")
-            msg_list.append(port_check)
+        Args:
+            max_workers (int): Maximum number of phones to check at the same time.
 
-            # 3. Optional: If port 80 is open, attempt a simple GET request to see if the page loads.
-            if "open" in port_check.lower():
-                http_result = self._http_get_request(ip, 80)
-                msg_list.append(http_result)
-                
-                # Further advanced logic: 
-                # - If the phone uses HTTPS on 443, swap port 443 or detect automatically.
-                # - If credentials are required, we could try basic authentication, etc.
+        Returns:
+            List[str]: One combined result string per phone, in self.phone_ips order.
+        """
+        sweep = self._probe_phones(self.phone_ips, max_workers)
+        if self.verbose:
+            pings = asyncio.gather(*(asyncio.to_thread(self._ping_test, ip) for ip in self.phone_ips))
+            probes, ping_results = await asyncio.gather(sweep, pings)
+        else:
+            probes, ping_results = await sweep, [None] * len(self.phone_ips)
 
-            phone_results.append("\n".join(msg_list))
+        return [self._phone_result(ip, status, ping_result)
+                for (ip, status), ping_result in zip(probes, ping_results)]
 
-        self.report_data["phone_checks"] = phone_results
+    def _phone_result(self, ip: str, status: Optional[int], ping_result: Optional[str]) -> str:
+        """
+        Private helper that formats the check results for a single phone.
+
+        Args:
+            ip (str): The IP address of the phone.
+            status (int, optional): The web interface's HTTP status, or None if it did not answer.
+            ping_result (str, optional): The ping test output (verbose mode only).
+
+        Returns:
+            str: The combined, newline-separated results for this phone.
+        """
+        msg_list = [f"Checking Polycom VVX 450 Phone @ IP: {ip}"]
+
+        # 1. Ping Test
+        if ping_result is not None:
+            msg_list.append(ping_result)
+
+        # 2. Phone's web interface. Many Polycom phones default to HTTP on port 80
+        #    or HTTPS on 443; _probe_phones tries HTTP on port 80.
+        #    Further advanced logic:
+        #    - If the phone uses HTTPS on 443, swap port 443 or detect automatically.
+        #    - If credentials are required, we could try basic authentication, etc.
+        url = f"http://{ip}:80/"
+        if status is None:
+            msg_list.append(f"HTTP GET to {url} failed: no response (port closed/filtered or phone offline).")
+        else:
+            msg_list.append(f"HTTP GET to {url} succeeded with status code {status}.")
+
+        return "\n".join(msg_list)
 
     def _ping_test(self, host: str) -> str:
         """
-        Private helper to ping a specified host and return the command output.
+        Private helper to check whether a specified host is reachable.
+
+        By default this is a single TCP connect (see _fast_reachable), which answers
+        in about one round trip. If that gets no answer (e.g. the port is filtered),
+        a single ICMP echo decides. In verbose mode the full OS ping command is run instead.
 
         Args:
             host (str): The host or IP to ping.
 
         Returns:
-            str: The raw output of the ping command or an error message.
+            str: The reachability result, the raw output of the ping command, or an error message.
         """
+        if not self.verbose:
+            if self._fast_reachable(host) or self._ping_once(host):
+                return f"Reachability Test to {host}: host is REACHABLE."
+            return f"Reachability Test to {host}: host is UNREACHABLE (no response)."
+
         try:
             if self.os_type == "Windows":
                 cmd = ["ping", "-n", "4", host]
@@ -313,6 +376,50 @@ class NetworkDiagnosticTool:
         except subprocess.CalledProcessError as e:
             return f"Error performing ping to {host}: {e.output}"
 
+    def _fast_reachable(self, host: str, port: int = 443, timeout: float = 1.0) -> bool:
+        """
+        Checks whether a host answers at all using a single TCP connect.
+
+        A refused connection (RST) still means the host responded, so it counts as
+        reachable. A timeout only means nothing answered on this port, which
+        firewalls commonly cause, so False is inconclusive rather than "down".
+
+        Args:
+            host (str): The hostname or IP address to check.
+            port (int): The TCP port to connect to (default 443, served by most
+                        public hosts such as 8.8.8.8 and by phone/PBX web UIs).
+            timeout (float): Seconds to wait before giving up.
+
+        Returns:
+            bool: True if the host accepted or refused the connection, False otherwise.
+        """
+        try:
+            with self._connect(host, port, timeout):
+                return True
+        except ConnectionRefusedError:
+            return True
+        except OSError:
+            return False
+
+    def _ping_once(self, host: str) -> bool:
+        """
+        Sends a single ICMP echo with the OS ping command; the fallback for
+        _ping_test when the TCP check is inconclusive.
+
+        Args:
+            host (str): The host or IP to ping.
+
+        Returns:
+            bool: True if the host replied, False otherwise (including no ping command).
+        """
+        count_flag = "-n" if self.os_type == "Windows" else "-c"
+        try:
+            subprocess.run(["ping", count_flag, "1", host], stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, timeout=5, check=True)
+            return True
+        except (subprocess.SubprocessError, OSError):
+            return False
+
     def _traceroute_test(self, host: str) -> str:
         """
         Private helper to run traceroute (or tracert on Windows) to the given host.
@@ -326,7 +433,7 @@ class NetworkDiagnosticTool:
         trace_cmd = "tracert" if self.os_type == "Windows" else "traceroute"
 
         try:
-            cmd_path = self.which_command([trace_cmd])
+            cmd_path = self.which_command((trace_cmd,))
             if cmd_path is None:
                 return f"{trace_cmd} is not installed or not found in PATH."
             else:
@@ -336,9 +443,107 @@ class NetworkDiagnosticTool:
         except subprocess.CalledProcessError as e:
             return f"Error performing {trace_cmd} to {host}: {e.output}"
 
-    def _check_tcp_port(self, host: str, port: int, label: str) -> str:
+    def _resolve(self, host: str) -> list:
+        """
+        Resolves a host with socket.getaddrinfo, caching the result so that
+        repeated checks against the same host only do one DNS lookup.
+        Works for both IPv4 and IPv6 hosts.
+
+        Args:
+            host (str): The hostname or IP address to resolve.
+
+        Returns:
+            list: getaddrinfo() tuples of (family, type, proto, canonname, sockaddr).
+
+        Raises:
+            socket.gaierror: if the host cannot be resolved.
+        """
+        addrs = self._addr_cache.get(host)
+        if addrs is None:
+            addrs = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+            self._addr_cache[host] = addrs
+        return addrs
+
+    def _connect(self, host: str, port: int, timeout: float) -> socket.socket:
         """
-        Checks if a TCP port is open on a given host by attempting to create a socket.
+        Opens a TCP connection like socket.create_connection, but using the
+        cached addresses from _resolve. Each address is tried in turn.
+
+        Args:
+            host (str): The hostname or IP address to connect to.
+            port (int): The port number to connect to.
+            timeout (float): Seconds to wait for each connection attempt.
+
+        Returns:
+            socket.socket: The connected socket (the caller must close it).
+
+        Raises:
+            OSError: if no address accepted the connection.
+        """
+        last_error: Optional[OSError] = None
+        for family, socktype, proto, _, sockaddr in self._resolve(host):
+            sock = socket.socket(family, socktype, proto)
+            sock.settimeout(timeout)
+            try:
+                sock.connect((sockaddr[0], port) + tuple(sockaddr[2:]))
+                return sock
+            except OSError as e:
+                sock.close()
+                last_error = e
+        raise last_error if last_error else OSError(f"No addresses found for {host}")
+
+    async def _async_resolve(self, host: str) -> list:
+        """
+        Async counterpart of _resolve that shares the same cache.
+
+        Args:
+            host (str): The hostname or IP address to resolve.
+
+        Returns:
+            list: getaddrinfo() tuples of (family, type, proto, canonname, sockaddr).
+        """
+        addrs = self._addr_cache.get(host)
+        if addrs is None:
+            loop = asyncio.get_running_loop()
+            addrs = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+            self._addr_cache[host] = addrs
+        return addrs
+
+    async def _async_connect(self, host: str, port: int,
+                             timeout: float) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Async counterpart of _connect: opens a TCP connection with
+        asyncio.open_connection, trying each cached address in turn, so a
+        dual-stack host whose first address is unreachable still connects.
+        The timeout is split evenly across the addresses, so one that is
+        blackholed (times out rather than refusing) can't use up the whole
+        budget before the next is tried.
+
+        Args:
+            host (str): The hostname or IP address to connect to.
+            port (int): The port number to connect to.
+            timeout (float): Total seconds to wait across all connection attempts.
+
+        Returns:
+            Tuple[asyncio.StreamReader, asyncio.StreamWriter]: The open stream pair.
+
+        Raises:
+            OSError, asyncio.TimeoutError: if no address accepted the connection.
+        """
+        addrs = await self._async_resolve(host)
+        per_addr_timeout = timeout / max(len(addrs), 1)
+        last_error: Optional[Exception] = None
+        for _, _, _, _, sockaddr in addrs:
+            try:
+                return await asyncio.wait_for(asyncio.open_connection(sockaddr[0], port),
+                                              timeout=per_addr_timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                last_error = e
+        raise last_error if last_error else OSError(f"No addresses found for {host}")
+
+    async def _async_check_tcp_port(self, host: str, port: int, label: str) -> str:
+        """
+        Checks if a TCP port is open on a given host using asyncio.open_connection.
 
         Args:
             host (str): The hostname or IP address to check.
@@ -348,48 +553,100 @@ class NetworkDiagnosticTool:
         Returns:
             str: A message indicating success or failure.
         """
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(3.0)  # 3-second timeout
         try:
-            sock.connect((host, port))
-            return f"{label} Port Check: Port {port} on {host} is OPEN."
-        except (socket.timeout, socket.error) as e:
+            _, writer = await self._async_connect(host, port, 3.0)
+        except asyncio.TimeoutError:
+            return f"{label} Port Check: Unable to reach port {port} on {host}. Error: timed out"
+        except OSError as e:
             return f"{label} Port Check: Unable to reach port {port} on {host}. Error: {str(e)}"
-        finally:
-            sock.close()
+        writer.close()
+        await writer.wait_closed()
+        return f"{label} Port Check: Port {port} on {host} is OPEN."
 
-    def _http_get_request(self, host: str, port: int) -> str:
+    async def _async_http_status(self, host: str, port: int, timeout: float = 3.0) -> int:
         """
-        Attempts a simple HTTP GET request to the given host and port.
+        Sends a minimal HTTP/1.0 GET over asyncio.open_connection and reads
+        back only the status line. The whole exchange is bounded by timeout.
 
         Args:
             host (str): The hostname or IP address to target.
-            port (int): The port number to use (80 for HTTP, 443 for HTTPS, etc.).
+            port (int): The port number to use (80 for HTTP).
+            timeout (float): Total seconds allowed for connect, send and reply.
 
         Returns:
-            str: A brief result string indicating success or error details.
+            int: The HTTP status code.
+
+        Raises:
+            OSError, asyncio.TimeoutError, ValueError: if the request fails.
         """
-        url = f"http://{host}:{port}/"
+        writer = None
+
+        async def exchange() -> int:
+            nonlocal writer
+            reader, writer = await self._async_connect(host, port, timeout)
+            writer.write(f"GET / HTTP/1.0\r\nHost: {host}\r\n\r\n".encode("ascii"))
+            await writer.drain()
+            status_line = await reader.readline()
+            # e.g. "HTTP/1.1 200 OK"
+            return int(status_line.split()[1])
+
         try:
-            with urllib.request.urlopen(url, timeout=3) as response:
-                status_code = response.getcode()
-                return f"HTTP GET to {url} succeeded with status code {status_code}."
-        except Exception as e:
-            return f"HTTP GET to {url} failed: {str(e)}"
+            return await asyncio.wait_for(exchange(), timeout=timeout)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    async def _probe_phones(self, ips: List[str], limit: int = 8) -> List[Tuple[str, Optional[int]]]:
+        """
+        Issues an HTTP GET to every phone's web interface concurrently
+        (at most `limit` in flight) with a 2-second total timeout each,
+        so unreachable phones cost 2s in parallel instead of 3s each in series.
+
+        Args:
+            ips (List[str]): Phone IP addresses to probe.
+            limit (int): Maximum number of concurrent requests.
+
+        Returns:
+            List[Tuple[str, Optional[int]]]: (ip, status code) pairs in input order;
+            the status is None if the phone did not answer.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def probe(ip: str) -> Tuple[str, Optional[int]]:
+            async with semaphore:
+                try:
+                    return ip, await self._async_http_status(ip, 80, timeout=2.0)
+                except Exception:
+                    return ip, None
+
+        return list(await asyncio.gather(*(probe(ip) for ip in ips)))
+
+    def probe_phones(self, ips: Optional[List[str]] = None, limit: int = 8) -> List[Tuple[str, Optional[int]]]:
+        """
+        Quick HTTP-only sweep of the phones' web interfaces (sync wrapper around _probe_phones).
+
+        Args:
+            ips (List[str], optional): Phone IPs to probe. Defaults to self.phone_ips.
+            limit (int): Maximum number of concurrent requests.
+
+        Returns:
+            List[Tuple[str, Optional[int]]]: (ip, status code or None) pairs.
+        """
+        return asyncio.run(self._probe_phones(ips if ips is not None else self.phone_ips, limit))
 
     @staticmethod
-    def which_command(commands: List[str]) -> Optional[str]:
+    @lru_cache(maxsize=32)
+    def which_command(commands: Tuple[str, ...]) -> Optional[str]:
         """
         Utility function to check if any of the provided commands exist in the PATH.
+        Results are cached, since PATH lookups don't change during a run.
 
         Args:
-            commands (List[str]): A list of command names to check.
+            commands (Tuple[str, ...]): A tuple of command names to check.
 
         Returns:
             str or None: The first command found in PATH, or None if none are found.
         """
-        import shutil
-
         for cmd in commands:
             found_path = shutil.which(cmd)
             if found_path is not None:
@@ -406,15 +663,20 @@ class NetworkDiagnosticTool:
         print("==============================================================")
         print(f"Operating System Detected: {self.report_data['os_type']}")
         print("\n---------------------- IP Configuration ----------------------")
-        print(self.report_data["ip_info"])
+        for line in self.report_data["ip_info"]:
+            print(line)
         print("\n---------------------- Default Gateway -----------------------")
-        print(self.report_data["gateway_info"])
+        for line in self.report_data["gateway_info"]:
+            print(line)
         print("\n---------------------- DNS Information -----------------------")
-        print(self.report_data["dns_info"])
+        for line in self.report_data["dns_info"]:
+            print(line)
         print("\n--------------------- ARP (MAC Table) ------------------------")
-        print(self.report_data["arp_table"])
+        for line in self.report_data["arp_table"]:
+            print(line)
         print("\n-------------------- Routing Table ---------------------------")
-        print(self.report_data["routing_table"])
+        for line in self.report_data["routing_table"]:
+            print(line)
         print("\n----------------- Additional Diagnostic Checks --------------")
         for idx, item in enumerate(self.report_data["additional_checks"], 1):
             print(f"Check #{idx}:\n{item}\n")
@@ -438,21 +700,36 @@ class NetworkDiagnosticTool:
 
     def run_all_diagnostics(self) -> None:
         """
-        Higher-level method to run all diagnostic functions in sequence
-        and then produce a report.
-        
+        Higher-level method to run all diagnostic functions and then produce a report.
+
+        The basic network checks and the additional checks are independent,
+        I/O-bound subprocess calls, so they run concurrently in a thread pool.
+        Each one writes a single report_data key, so no locking is needed and
+        total wall time is roughly that of the slowest command (usually traceroute).
+
         This includes:
             - Basic network checks
             - Additional checks (ping/traceroute to known host)
             - PBX connectivity checks
             - Polycom phone checks
         """
-        self.gather_ip_info()
-        self.gather_gateway_info()
-        self.gather_dns_info()
-        self.gather_arp_table()
-        self.gather_routing_table()
-        self.perform_additional_checks()
+        gather_steps = {
+            "ip_info": self.gather_ip_info,
+            "gateway_info": self.gather_gateway_info,
+            "dns_info": self.gather_dns_info,
+            "arp_table": self.gather_arp_table,
+            "routing_table": self.gather_routing_table,
+            "additional_checks": self.perform_additional_checks,
+        }
+        with ThreadPoolExecutor(max_workers=len(gather_steps)) as executor:
+            futures = {executor.submit(step): field for field, step in gather_steps.items()}
+            for future in as_completed(futures):
+                field = futures[future]
+                try:
+                    future.result()
+                except OSError as e:
+                    # e.g. the command is missing from PATH (FileNotFoundError)
+                    self.report_data[field] = [f"Error gathering {field}: {e}"]
 
         # Run PBX check only if PBX address is supplied
         if self.pbx_address:
@@ -1,10 +1,178 @@
 import os
+import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from itertools import repeat
 import platform
 import plistlib
 import json
 
+try:
+    import orjson
+except ImportError:  # optional, faster JSON encoder
+    orjson = None
+
+# Apps smaller than this score as "very small"
+SMALL_APP_BYTES = 10 * 1024 * 1024
+
+# App names suggesting a trial, demo or outdated copy
+_TRIAL_RE = re.compile(r'demo|trial|beta|old', re.IGNORECASE)
+
+def _dir_size(path, limit=None):
+    """
+    Recursively sum file sizes under path using os.scandir.
+
+    DirEntry caches the type information from the directory listing, so each
+    file costs a single lstat. Localization folders (*.lproj) are skipped:
+    they hold many tiny files but contribute negligible bytes.
+
+    If limit is given, the walk stops as soon as the total reaches it, so
+    the result is only a lower bound once it is >= limit.
+    """
+    total = 0
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.endswith('.lproj'):
+                            pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                        if limit is not None and total >= limit:
+                            return total
+        except OSError:
+            continue
+    return total
+
+def _parse_mdls_date(value):
+    """
+    Parse an mdls date value (e.g. '2024-01-31 18:02:11 +0000') into a naive
+    local datetime, so it can be compared with datetime.now(). Returns None
+    for '(null)' or unparseable values.
+    """
+    try:
+        parsed = datetime.strptime(value.strip().strip('"'), '%Y-%m-%d %H:%M:%S %z')
+    except ValueError:
+        return None
+    return parsed.astimezone().replace(tzinfo=None)
+
+def _get_last_used_date(app_path):
+    """
+    Retrieve the last used date for an application
+    """
+    try:
+        # Use macOS-specific command to get last used date.
+        # Passing an argument list (no shell) avoids quoting issues with app names.
+        cmd = ['mdls', '-name', 'kMDItemLastUsedDate', app_path]
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        
+        if result.stdout.strip():
+            # Parse the date from the output
+            return _parse_mdls_date(result.stdout.split('=', 1)[1])
+    except Exception:
+        pass
+    return None
+
+def _read_bundle_info(app_path):
+    """
+    Read (CFBundleIdentifier, CFBundleShortVersionString) from an app's
+    Info.plist, or (None, None) if it can't be read. The format is picked
+    from the file header so plistlib doesn't have to detect it.
+    """
+    info_plist_path = os.path.join(app_path, 'Contents', 'Info.plist')
+    try:
+        with open(info_plist_path, 'rb') as f:
+            data = f.read()
+        fmt = plistlib.FMT_BINARY if data[:8] == b'bplist00' else plistlib.FMT_XML
+        plist_data = plistlib.loads(data, fmt=fmt)
+        return plist_data.get('CFBundleIdentifier'), plist_data.get('CFBundleShortVersionString')
+    except Exception:
+        return None, None
+
+def _json_default(obj):
+    """
+    Serialize values the stdlib json encoder doesn't handle (datetimes as ISO 8601).
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+def _analyze_single_app(app_path, now, one_year_ago, two_years_ago, dates=None):
+    """
+    Perform detailed analysis on a single application.
+
+    This is a module-level function (no self) so it can run in a
+    ProcessPoolExecutor worker. dates is the (last_used, created) tuple
+    from MacApplicationCleaner.get_metadata_batch, or None to look up the
+    last used date with a separate mdls call.
+    """
+    try:
+        # Basic file system information
+        file_stats = os.stat(app_path)
+
+        # Last used and creation dates (from the batched mdls call when available)
+        if dates is not None:
+            last_used, creation_time = dates
+        else:
+            last_used, creation_time = _get_last_used_date(app_path), None
+        if creation_time is None:
+            creation_time = datetime.fromtimestamp(file_stats.st_ctime)
+        
+        app_name = os.path.splitext(os.path.basename(app_path))[0]
+
+        # Deletion criteria
+        deletion_score = 0
+        reasons = []
+
+        # Criteria 1: Not used in the last year
+        if not last_used or last_used < one_year_ago:
+            deletion_score += 30
+            reasons.append("Not used in over a year")
+
+        # Criteria 2: Very old application
+        if creation_time < two_years_ago:  # 2 years
+            deletion_score += 20
+            reasons.append("Installed over 2 years ago")
+
+        # Criteria 3: Small or potentially redundant applications
+        # Only the < 10MB test needs the size, so stop walking once it's exceeded
+        app_size = _dir_size(app_path, limit=SMALL_APP_BYTES)
+        
+        if app_size < SMALL_APP_BYTES:  # Less than 10MB
+            deletion_score += 10
+            reasons.append("Very small application size")
+
+        # Criteria 4: Check for duplicate/redundant apps
+        if _TRIAL_RE.search(app_name):
+            deletion_score += 15
+            reasons.append("Potentially outdated or trial version")
+
+        # If we have a significant deletion score, consider it a candidate.
+        # Info.plist is only needed for the report, so parse it just for candidates.
+        if deletion_score >= 30:
+            bundle_identifier, version = _read_bundle_info(app_path)
+            return {
+                'name': app_name,
+                'path': app_path,
+                'bundle_id': bundle_identifier,
+                'version': version,
+                'creation_date': creation_time,
+                'last_used': last_used,
+                'size_bytes': app_size,
+                'size_is_lower_bound': app_size >= SMALL_APP_BYTES,
+                'deletion_score': deletion_score,
+                'reasons': reasons
+            }
+        
+        return None
+
+    except Exception as e:
+        print(f"Error analyzing {app_path}: {e}")
+        return None
+
 class MacApplicationCleaner:
     def __init__(self, output_file='app_analysis.json'):
         """
@@ -14,23 +182,60 @@ class MacApplicationCleaner:
         self.user_applications_dir = os.path.expanduser('~/Applications')
         self.output_file = output_file
         self.app_candidates = []
+        self.metadata = {}
 
     def get_last_used_date(self, app_path):
         """
         Retrieve the last used date for an application
         """
+        return _get_last_used_date(app_path)
+
+    def get_metadata_batch(self, app_paths):
+        """
+        Retrieve last used and content creation dates for many applications
+        with a single mdls invocation.
+
+        Returns a dict mapping app path -> (last_used, created), where either
+        value may be None.
+        """
+        metadata = {}
+        if not app_paths:
+            return metadata
+
+        cmd = ['mdls', '-name', 'kMDItemLastUsedDate',
+               '-name', 'kMDItemContentCreationDate'] + list(app_paths)
         try:
-            # Use macOS-specific command to get last used date
-            cmd = f'mdls -name kMDItemLastUsedDate "{app_path}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.stdout.strip():
-                # Parse the date from the output
-                date_str = result.stdout.split('=')[1].strip().strip('"')
-                return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S %z')
-        except Exception:
-            pass
-        return None
+            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        except OSError:
+            return metadata
+
+        # mdls prints one 'key = value' line per requested attribute for each
+        # file, in argument order. A repeated key marks the start of the next file.
+        blocks = []
+        current = {}
+        for line in result.stdout.splitlines():
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            key = key.strip()
+            if key in current:
+                blocks.append(current)
+                current = {}
+            current[key] = value
+        if current:
+            blocks.append(current)
+
+        if len(blocks) != len(app_paths):
+            # Output doesn't line up with the inputs (e.g. an unreadable path);
+            # let callers fall back to per-app lookups.
+            return metadata
+
+        for app_path, block in zip(app_paths, blocks):
+            metadata[app_path] = (
+                _parse_mdls_date(block.get('kMDItemLastUsedDate', '')),
+                _parse_mdls_date(block.get('kMDItemContentCreationDate', '')),
+            )
+        return metadata
 
     def analyze_applications(self):
         """
@@ -41,98 +246,57 @@ class MacApplicationCleaner:
             self.user_applications_dir
         ]
 
+        app_paths = []
         for directory in search_dirs:
             if not os.path.exists(directory):
                 continue
 
             for item in os.listdir(directory):
                 if item.endswith('.app'):
-                    full_path = os.path.join(directory, item)
-                    app_info = self.analyze_single_app(full_path)
-                    if app_info:
-                        self.app_candidates.append(app_info)
+                    app_paths.append(os.path.join(directory, item))
 
-    def analyze_single_app(self, app_path):
+        # One mdls call for every app instead of one per app
+        self.metadata = self.get_metadata_batch(app_paths)
+
+        # Use the same reference time for every app in this scan
+        now = datetime.now()
+        one_year_ago = now - timedelta(days=365)
+        two_years_ago = now - timedelta(days=730)
+
+        # Size walks and plist parsing are independent per app, so spread
+        # them across processes; chunksize amortizes the IPC overhead.
+        dates = [self.metadata.get(path) for path in app_paths]
+        with ProcessPoolExecutor() as pool:
+            results = pool.map(_analyze_single_app, app_paths, repeat(now),
+                               repeat(one_year_ago), repeat(two_years_ago), dates,
+                               chunksize=8)
+            self.app_candidates.extend(app_info for app_info in results if app_info)
+
+    def analyze_single_app(self, app_path, now=None, one_year_ago=None, two_years_ago=None):
         """
-        Perform detailed analysis on a single application
+        Perform detailed analysis on a single application.
+        The reference times are computed from datetime.now() if not given.
         """
-        try:
-            # Basic file system information
-            file_stats = os.stat(app_path)
-            creation_time = datetime.fromtimestamp(file_stats.st_ctime)
-            
-            # Last used date
-            last_used = self.get_last_used_date(app_path)
-            
-            # Try to extract app bundle information
-            info_plist_path = os.path.join(app_path, 'Contents', 'Info.plist')
-            app_name = os.path.splitext(os.path.basename(app_path))[0]
-            bundle_identifier = None
-            version = None
-
-            try:
-                with open(info_plist_path, 'rb') as f:
-                    plist_data = plistlib.load(f)
-                    bundle_identifier = plist_data.get('CFBundleIdentifier')
-                    version = plist_data.get('CFBundleShortVersionString')
-            except Exception:
-                pass
-
-            # Deletion criteria
-            deletion_score = 0
-            reasons = []
-
-            # Criteria 1: Not used in the last year
-            if not last_used or (datetime.now() - last_used) > timedelta(days=365):
-                deletion_score += 30
-                reasons.append("Not used in over a year")
-
-            # Criteria 2: Very old application
-            if (datetime.now() - creation_time) > timedelta(days=730):  # 2 years
-                deletion_score += 20
-                reasons.append("Installed over 2 years ago")
-
-            # Criteria 3: Small or potentially redundant applications
-            app_size = sum(os.path.getsize(os.path.join(dirpath,filename)) 
-                           for dirpath, _, filenames in os.walk(app_path) 
-                           for filename in filenames)
-            
-            if app_size < 10*1024*1024:  # Less than 10MB
-                deletion_score += 10
-                reasons.append("Very small application size")
-
-            # Criteria 4: Check for duplicate/redundant apps
-            if any(x in app_name.lower() for x in ['demo', 'trial', 'beta', 'old']):
-                deletion_score += 15
-                reasons.append("Potentially outdated or trial version")
-
-            # If we have a significant deletion score, consider it a candidate
-            if deletion_score >= 30:
-                return {
-                    'name': app_name,
-                    'path': app_path,
-                    'bundle_id': bundle_identifier,
-                    'version': version,
-                    'creation_date': creation_time.isoformat(),
-                    'last_used': last_used.isoformat() if last_used else None,
-                    'size_bytes': app_size,
-                    'deletion_score': deletion_score,
-                    'reasons': reasons
-                }
-            
-            return None
-
-        except Exception as e:
-            print(f"Error analyzing {app_path}: {e}")
-            return None
+        if now is None:
+            now = datetime.now()
+        if one_year_ago is None:
+            one_year_ago = now - timedelta(days=365)
+        if two_years_ago is None:
+            two_years_ago = now - timedelta(days=730)
+        return _analyze_single_app(app_path, now, one_year_ago, two_years_ago,
+                                   self.metadata.get(app_path))
 
     def save_results(self):
         """
         Save analysis results to a JSON file
         """
         if self.app_candidates:
-            with open(self.output_file, 'w') as f:
-                json.dump(self.app_candidates, f, indent=2)
+            if orjson is not None:
+                with open(self.output_file, 'wb') as f:
+                    f.write(orjson.dumps(self.app_candidates, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.output_file, 'w') as f:
+                    json.dump(self.app_candidates, f, indent=2, default=_json_default)
             print(f"Analysis saved to {self.output_file}")
         else:
             print("No applications found as deletion candidates.")
@@ -151,8 +315,11 @@ class MacApplicationCleaner:
             print(f"Path: {app['path']}")
             print(f"Version: {app.get('version', 'Unknown')}")
             print(f"Creation Date: {app['creation_date']}")
-            print(f"Last Used: {app.get('last_used', 'Never')}")
-            print(f"Size: {app['size_bytes'] / 1024 / 1024:.2f} MB")
+            print(f"Last Used: {app.get('last_used') or 'Never'}")
+            if app.get('size_is_lower_bound'):
+                print(f"Size: >= {SMALL_APP_BYTES / 1024 / 1024:.0f} MB")
+            else:
+                print(f"Size: {app['size_bytes'] / 1024 / 1024:.2f} MB")
             print("Deletion Reasons:")
             for reason in app['reasons']:
                 print(f"  - {reason}")
@@ -5,7 +5,90 @@
 # Inputs: None
 # Outputs: A MIDI file with a basic drum groove.
 
-from mido import Message, MidiFile, MidiTrack
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from mido import Message, MetaMessage, MidiFile, MidiTrack
+
+# Drum pattern: 1 measure of 4/4
+# Kick on 1 and 3, Snare on 2 and 4, Hi-Hat on every 8th note
+DEFAULT_PATTERN = [
+    (36, 0),   # Kick
+    (42, 120), # Hi-Hat
+    (38, 120), # Snare
+    (42, 120), # Hi-Hat
+    (36, 120), # Kick
+    (42, 120), # Hi-Hat
+    (38, 120), # Snare
+    (42, 120)  # Hi-Hat
+]
+
+def build_track(pattern=DEFAULT_PATTERN, measures=4, tempo=500000):
+    """
+    Builds a MIDI drum track in memory (no file I/O).
+    pattern is a list of (note, duration_in_ticks) steps for one measure,
+    repeated for the given number of measures.
+    tempo is in microseconds per beat (500000 = 120 BPM).
+    """
+    track = MidiTrack()
+
+    # Add tempo meta message
+    track.append(MetaMessage('set_tempo', tempo=tempo, time=0))
+    track.append(Message('program_change', program=0, time=0))
+
+    # Build (absolute_tick, type, note) events first, then convert to delta times.
+    step_ticks = [0]
+    for _, duration in pattern:
+        step_ticks.append(step_ticks[-1] + duration)
+    measure_ticks = step_ticks[-1]
+    events = [
+        event
+        for measure in range(measures)
+        for (note, duration), start in zip(pattern, step_ticks)
+        for event in (
+            (measure * measure_ticks + start, 'note_on', note),
+            (measure * measure_ticks + start + duration, 'note_off', note),
+        )
+    ]
+    events.sort(key=lambda event: event[0])  # stable: keeps note_off before the next note_on
+
+    last_tick = 0
+    for tick, msg_type, note in events:
+        track.append(Message(msg_type, note=note, velocity=64, time=tick - last_tick))
+        last_tick = tick
+    return track
+
+def _build_spec(spec):
+    """
+    Builds the track for one (file_name, pattern, measures, tempo) spec.
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    """
+    _, pattern, measures, tempo = spec
+    return build_track(pattern, measures, tempo)
+
+async def _save_all(specs, tracks):
+    """
+    Writes every track to its file concurrently.
+    """
+    saves = []
+    for (file_name, _, _, _), track in zip(specs, tracks):
+        mid = MidiFile()
+        mid.tracks.append(track)
+        saves.append(asyncio.to_thread(mid.save, file_name))
+    await asyncio.gather(*saves)
+
+def save_grooves(specs):
+    """
+    Generates many grooves in one go.
+    specs is a list of (file_name, pattern, measures, tempo) tuples.
+    Tracks are built in parallel processes, then all files are written concurrently.
+    """
+    specs = list(specs)
+    with ProcessPoolExecutor() as pool:
+        tracks = list(pool.map(_build_spec, specs))
+    asyncio.run(_save_all(specs, tracks))
+    for file_name, _, _, _ in specs:
+        print(f"MIDI drum groove saved as {file_name}")
 
 def create_drum_groove(file_name="drum_groove.mid"):
     """
@@ -16,34 +99,9 @@ def create_drum_groove(file_name="drum_groove.mid"):
     - Hi-Hat Closed: Note 42 (F#1)
     """
     mid = MidiFile()
-    track = MidiTrack()
-    mid.tracks.append(track)
-
-    # Time signature: 4/4
-    tempo = 500000  # Microseconds per beat (120 BPM)
-
-    # Add tempo meta message
-    track.append(Message('program_change', program=0, time=0))
-
-    # Drum pattern: 1 measure of 4/4
-    # Kick on 1 and 3, Snare on 2 and 4, Hi-Hat on every 8th note
-    pattern = [
-        (36, 0),   # Kick
-        (42, 120), # Hi-Hat
-        (38, 120), # Snare
-        (42, 120), # Hi-Hat
-        (36, 120), # Kick
-        (42, 120), # Hi-Hat
-        (38, 120), # Snare
-        (42, 120)  # Hi-Hat
-    ]
+    # Time signature: 4/4, 120 BPM, repeated for 4 measures
+    mid.tracks.append(build_track(DEFAULT_PATTERN, measures=4, tempo=500000))
 
-    # Repeat the pattern for 4 measures
-    for _ in range(4):
-        for note, duration in pattern:
-            track.append(Message('note_on', note=note, velocity=64, time=0))
-            track.append(Message('note_off', note=note, velocity=64, time=duration))
-    
     # Save the file
     mid.save(file_name)
     print(f"MIDI drum groove saved as {file_name}")
@@ -1,74 +1,449 @@
+import argparse
+import errno
 import os
 import shutil
+import stat
 import subprocess
 import sys
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import zstandard
+except ImportError:  # optional: --archive falls back to gzip without it
+    zstandard = None
 
 # Constants
 BACKUP_FOLDER = "Backup_{date}".format(date=datetime.now().strftime("%Y%m%d_%H%M%S"))
 
-def create_backup(source_paths, backup_path):
+# Copy with 1 MiB buffers instead of shutil's 64 KiB default: far fewer read/write
+# syscalls per file on SSDs and network mounts. Each parallel copy worker holds
+# one buffer, so peak memory is roughly workers x 1 MiB.
+COPY_BUFSIZE = 1024 * 1024
+if hasattr(shutil, "COPY_BUFSIZE"):
+    shutil.COPY_BUFSIZE = COPY_BUFSIZE
+
+# Keeps log lines from parallel copy workers from interleaving
+_print_lock = threading.Lock()
+
+def _log(message):
+    """
+    Thread-safe print.
+    """
+    with _print_lock:
+        print(message)
+
+# errno values meaning "this fast copy syscall can't be used for these files"
+_KERNEL_COPY_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP,
+                            errno.ENOTSUP, errno.EBADF, errno.ENOTSOCK, errno.EPERM}
+
+def _kernel_copy(in_fd, out_fd):
+    """
+    Copies in_fd to out_fd inside the kernel, trying copy_file_range (which can
+    reflink on Btrfs/XFS) and then sendfile. Returns False if neither syscall
+    is usable and nothing was copied, so the caller can fall back.
+    Like CPython's _fastcopy_sendfile, a first call that returns 0 counts as
+    unsupported: procfs/sysfs, some FUSE/NFS mounts and older kernels'
+    cross-filesystem copies report EOF straight away instead of failing.
+    sendfile only accepts a regular file as out_fd on Linux (macOS and the BSDs
+    require a socket), so it is skipped elsewhere.
+    """
+    for name in ("copy_file_range", "sendfile"):
+        if not hasattr(os, name):
+            continue
+        if name == "sendfile" and not sys.platform.startswith("linux"):
+            continue
+        copied = 0
+        try:
+            while True:
+                if name == "copy_file_range":
+                    sent = os.copy_file_range(in_fd, out_fd, 1 << 30)
+                else:
+                    sent = os.sendfile(out_fd, in_fd, None, 1 << 30)
+                if sent == 0:
+                    if copied:
+                        return True
+                    break  # nothing copied: try the next syscall
+                copied += sent
+        except OSError as e:
+            if copied or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+    return False
+
+def _fast_copy(src, dst, is_regular=None):
+    """
+    Replacement for shutil.copy2 (also usable as a copytree copy_function)
+    that uses zero-copy syscalls on POSIX. Windows keeps shutil.copy2, which
+    already uses CopyFile2. Unlike copy2, dst must be the destination file
+    path, not a directory, which saves a stat per file.
+    Pass is_regular when the file type is already known (e.g. from a
+    DirEntry) to skip a stat call.
+    """
+    if is_regular is None:
+        is_regular = stat.S_ISREG(os.stat(src).st_mode)
+    if os.name == "nt" or not is_regular:
+        return shutil.copy2(src, dst)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if not _kernel_copy(fsrc.fileno(), fdst.fileno()):
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+    shutil.copystat(src, dst)
+    return dst
+
+def _fast_copytree(src, dst):
+    """
+    Recursively copies the directory src to dst, like shutil.copytree with
+    dirs_exist_ok=True (symlinks are followed). The walk uses os.scandir and
+    reuses each DirEntry's cached type information instead of stat-ing every
+    entry again. Errors are collected and raised together as shutil.Error.
+    """
+    os.makedirs(dst, exist_ok=True)
+    errors = []
+    with os.scandir(src) as entries:
+        for entry in entries:
+            dst_path = os.path.join(dst, entry.name)
+            try:
+                if entry.is_dir():
+                    _fast_copytree(entry.path, dst_path)
+                else:
+                    _fast_copy(entry.path, dst_path, is_regular=entry.is_file())
+            except shutil.Error as e:
+                errors.extend(e.args[0])
+            except OSError as e:
+                errors.append((entry.path, dst_path, str(e)))
+    try:
+        shutil.copystat(src, dst)
+    except OSError as e:
+        errors.append((src, dst, str(e)))
+    if errors:
+        raise shutil.Error(errors)
+    return dst
+
+# Trees with more entries than this are handed to the OS-native copier
+NATIVE_COPY_MIN_ENTRIES = 1000
+
+def _has_more_entries_than(path, limit):
+    """
+    Counts directory entries under path with os.scandir, stopping as soon
+    as the count exceeds limit (so huge trees aren't fully walked).
+    """
+    count = 0
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    count += 1
+                    if count > limit:
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
+    return False
+
+def _native_copytree(src, dst):
+    """
+    Copies a large directory tree with the platform's native copier:
+    multi-threaded robocopy on Windows, `cp -aL` elsewhere (with reflinks on
+    Linux). Symlinks are followed, as in _fast_copytree, so a tree is copied
+    the same way whichever path its size selects. Returns False if the tool
+    isn't available or the tree is small enough for the Python copy path.
+    """
+    if os.name == "nt":
+        tool = shutil.which("robocopy")
+    else:
+        tool = shutil.which("cp")
+    if tool is None or not _has_more_entries_than(src, NATIVE_COPY_MIN_ENTRIES):
+        return False
+
+    os.makedirs(dst, exist_ok=True)
+    if os.name == "nt":
+        cmd = [tool, str(src), str(dst), "/E", "/MT:16", "/NFL", "/NDL"]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        # robocopy exit codes below 8 mean success (with or without copies)
+        if result.returncode >= 8:
+            raise shutil.Error([(str(src), str(dst), result.stdout.strip())])
+    else:
+        cmd = [tool, "-aL"]
+        if sys.platform.startswith("linux"):
+            cmd.append("--reflink=auto")
+        cmd += [os.path.join(src, "."), str(dst)]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise shutil.Error([(str(src), str(dst), result.stderr.strip())])
+    return True
+
+@lru_cache(maxsize=None)
+def _tree_size(path):
+    """
+    Total size in bytes of a file, or of every file under a directory
+    (os.scandir walk, no symlink following). Cached, so the backup and
+    migration phases only walk each source once.
+    """
+    try:
+        st = os.stat(path, follow_symlinks=False)
+    except OSError:
+        return 0
+    if not stat.S_ISDIR(st.st_mode):
+        return st.st_size
+
+    total = 0
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+def _unique_sources(source_paths):
+    """
+    Returns source_paths as Path objects with duplicates (paths resolving to
+    the same location) removed, keeping the first occurrence.
+    """
+    unique = {}
+    for source in source_paths:
+        src = Path(source)
+        unique.setdefault(src.resolve(), src)
+    return list(unique.values())
+
+def _stat_sources(source_paths):
+    """
+    Stats each source once, without following symlinks. Returns a dict mapping
+    Path -> os.stat_result, or None for sources that don't exist (including
+    dangling symlinks) or can't be stat-ed, so the backup and migration phases
+    can check existence and type without another stat() round trip (slow on
+    network shares). Clean-up runs after the sources have been replaced by
+    symlinks, so it must not reuse these results.
+    """
+    stats = {}
+    for source in source_paths:
+        src = Path(source)
+        try:
+            st = os.stat(src, follow_symlinks=False)
+            if stat.S_ISLNK(st.st_mode) and not os.path.exists(src):
+                st = None  # dangling symlink: nothing to copy
+        except FileNotFoundError:
+            st = None
+        except OSError as e:
+            _log(f"Warning: Cannot access source path {src}: {e}")
+            st = None
+        stats[src] = st
+    return stats
+
+def _is_dir(src, st):
+    """
+    Whether src is (or, for a symlink, points to) a directory, given its
+    _stat_sources result. Only symlinks cost an extra stat.
+    """
+    if stat.S_ISLNK(st.st_mode):
+        return os.path.isdir(src)
+    return stat.S_ISDIR(st.st_mode)
+
+def _largest_first(pairs):
+    """
+    Orders (src, dest) pairs by source size, biggest first, so the big copies
+    start early and parallel workers don't finish on one long straggler.
+    """
+    if len(pairs) < 2:
+        return pairs
+    return sorted(pairs, key=lambda pair: _tree_size(pair[0]), reverse=True)
+
+def _copy_one(src, dest, st=None):
+    """
+    Copies a single file or directory tree from src to dest.
+    st is src's stat result, if the caller already has it.
+    """
+    if st is None:
+        st = os.stat(src, follow_symlinks=False)
+    if stat.S_ISLNK(st.st_mode):
+        st = os.stat(src)  # copy what the link points to, as copy2/copytree would
+    if stat.S_ISDIR(st.st_mode):
+        if not _native_copytree(src, dest):
+            _fast_copytree(src, dest)
+    else:
+        _fast_copy(src, dest, is_regular=stat.S_ISREG(st.st_mode))
+    return src, dest
+
+def _check_destinations(pairs):
+    """
+    Refuses (src, dest) pairs that would copy onto an existing path, or two
+    sources onto one destination. The copies merge into existing directories,
+    so either would silently mix trees, and clean_up would then remove both
+    originals. Raises FileExistsError before anything is copied.
+    """
+    seen = {}
+    for src, dest in pairs:
+        if dest in seen:
+            raise FileExistsError(f"{seen[dest]} and {src} would both be copied to {dest}")
+        if os.path.lexists(dest):
+            raise FileExistsError(f"Destination already exists: {dest}")
+        seen[dest] = src
+
+def _copy_all(pairs, label, stats):
+    """
+    Copies (src, dest) pairs in parallel, logging each one as it finishes.
+    stats is the _stat_sources mapping for the sources.
+    The first copy error is re-raised once the running copies are done.
+    """
+    if not pairs:
+        return
+    with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as executor:
+        futures = [executor.submit(_copy_one, src, dest, stats.get(src)) for src, dest in pairs]
+        for future in as_completed(futures):
+            src, dest = future.result()
+            _log(f"{label}: {src} -> {dest}")
+
+def _archive_sources(sources, backup_dir):
+    """
+    Streams sources into a single compressed tarball in backup_dir: one large
+    sequential write instead of a create/write/close per file, which matters
+    on network mounts. Uses zstd when the zstandard package is installed,
+    gzip otherwise. Symlinks are archived as what they point to, as the copy
+    mode does, so a symlinked source is backed up with its data. Returns the
+    archive path.
+
+    Restore with tarfile.open(path, "r|gz"), or for .tar.zst by wrapping
+    zstandard.ZstdDecompressor().stream_reader(f) in tarfile.open(fileobj=..., mode="r|").
+    """
+    if zstandard is not None:
+        archive_path = backup_dir / "backup.tar.zst"
+        with open(archive_path, "wb") as raw, \
+                zstandard.ZstdCompressor().stream_writer(raw) as compressed, \
+                tarfile.open(fileobj=compressed, mode="w|", dereference=True) as tar:
+            for src in sources:
+                tar.add(src, arcname=src.name)
+                _log(f"Archived: {src} -> {archive_path}")
+    else:
+        archive_path = backup_dir / "backup.tar.gz"
+        with tarfile.open(os.fspath(archive_path), mode="w|gz", dereference=True) as tar:
+            for src in sources:
+                tar.add(src, arcname=src.name)
+                _log(f"Archived: {src} -> {archive_path}")
+    return archive_path
+
+def create_backup(source_paths, backup_path, stats=None, archive=False):
     """
     Creates a backup of the specified source files/folders to a backup directory.
+    Duplicate sources are skipped; the rest are copied in parallel, largest first.
+    Sources sharing a name, or an existing destination, abort the backup.
+    With archive=True the sources are streamed into one compressed tarball
+    instead of being copied file by file.
+    stats is an optional _stat_sources result to reuse.
     """
     try:
         backup_dir = Path(backup_path) / BACKUP_FOLDER
         backup_dir.mkdir(parents=True, exist_ok=True)
 
-        for source in source_paths:
-            src = Path(source)
-            if src.exists():
-                dest = backup_dir / src.name
-                if src.is_dir():
-                    shutil.copytree(src, dest)
-                else:
-                    shutil.copy2(src, dest)
-                print(f"Backed up: {src} -> {dest}")
+        sources = _unique_sources(source_paths)
+        if stats is None:
+            stats = _stat_sources(sources)
+        pairs = []
+        for src in sources:
+            if stats.get(src) is not None:
+                pairs.append((src, backup_dir / src.name))
             else:
                 print(f"Warning: Source path does not exist: {src}")
+        _check_destinations(pairs)
+        if archive:
+            _archive_sources([src for src, _ in pairs], backup_dir)
+        else:
+            _copy_all(_largest_first(pairs), "Backed up", stats)
         return backup_dir
     except Exception as e:
         print(f"Error during backup: {e}")
         sys.exit(1)
 
-def migrate_files(source_paths, target_path):
+def migrate_files(source_paths, target_path, stats=None, moved=None):
     """
     Migrates files and directories from source to target while preserving directory structure.
+    Duplicate sources are skipped; sources sharing a name, or a name that
+    already exists in the target, abort the migration before anything is
+    copied or moved. Sources on the same filesystem as the target
+    are simply renamed into place (a metadata-only operation); the rest, and
+    symlinked sources (renaming would move only the link), are copied in
+    parallel, largest first. The copies run before any rename, and renames are
+    undone if a copy fails, so a failed migration leaves every source in place.
+    stats is an optional _stat_sources result to reuse. If moved is a set, the
+    renamed sources are added to it: they no longer exist at their original
+    path, so they must not be cleaned up afterwards.
     """
     try:
         target_dir = Path(target_path)
         target_dir.mkdir(parents=True, exist_ok=True)
-        for source in source_paths:
-            src = Path(source)
-            if not src.exists():
+        target_dev = os.stat(target_dir).st_dev
+        sources = _unique_sources(source_paths)
+        if stats is None:
+            stats = _stat_sources(sources)
+        pairs = []
+        renames = []
+        for src in sources:
+            st = stats.get(src)
+            if st is None:
                 print(f"Error: Source path does not exist: {src}")
                 continue
             dest = target_dir / src.name
-            if src.is_dir():
-                shutil.copytree(src, dest)
+            if not stat.S_ISLNK(st.st_mode) and st.st_dev == target_dev:
+                renames.append((src, dest))
+            else:
+                pairs.append((src, dest))
+        _check_destinations(pairs + renames)
+        # A failed copy exits before create_symlinks runs, so copy first: a
+        # source renamed by then would be left with no link back to it
+        _copy_all(_largest_first(pairs), "Migrated", stats)
+        renamed = []
+        fallback = []
+        for src, dest in renames:
+            try:
+                os.rename(src, dest)
+            except OSError:
+                fallback.append((src, dest))  # e.g. a bind mount that reports the same device
             else:
-                shutil.copy2(src, dest)
-            print(f"Migrated: {src} -> {dest}")
+                renamed.append((src, dest))
+                _log(f"Migrated (renamed): {src} -> {dest}")
+        try:
+            _copy_all(_largest_first(fallback), "Migrated", stats)
+        except Exception:
+            for src, dest in reversed(renamed):
+                os.rename(dest, src)
+                _log(f"Rolled back: {dest} -> {src}")
+            raise
+        if moved is not None:
+            moved.update(src for src, _ in renamed)
         return target_dir
     except Exception as e:
         print(f"Error during migration: {e}")
         sys.exit(1)
 
-def create_symlinks(source_paths, target_path):
+def create_symlinks(source_paths, target_path, stats=None):
     """
     Creates symbolic links for migrated files and directories.
+    stats is an optional _stat_sources result to reuse.
     """
+    if stats is None:
+        stats = _stat_sources(source_paths)
+    target_root = os.fspath(target_path)
     for source in source_paths:
         src = Path(source)
-        if not src.exists():
+        st = stats.get(src)
+        if st is None:
             print(f"Warning: Source path does not exist: {src}")
             continue
         symlink_path = src
-        target = Path(target_path) / src.name
+        target = os.path.join(target_root, src.name)
         try:
-            src.unlink()  # Remove existing file/directory
-            symlink_path.symlink_to(target, target.is_dir())
+            src.unlink(missing_ok=True)  # Remove existing file/directory (gone if it was renamed)
+            # The migrated copy has the same type as the source
+            symlink_path.symlink_to(target, _is_dir(src, st))
             print(f"Symlink created: {symlink_path} -> {target}")
         except Exception as e:
             print(f"Error creating symlink for {src}: {e}")
@@ -77,52 +452,157 @@ def update_environment_variables(env_vars, target_path):
     """
     Updates environment variables pointing to the new file locations.
     """
+    target_root = os.fspath(target_path)
     for var, original_path in env_vars.items():
-        new_path = str(Path(target_path) / Path(original_path).name)
+        # normpath drops a trailing separator, matching Path(...).name
+        name = os.path.basename(os.path.normpath(os.fspath(original_path)))
+        new_path = os.path.join(target_root, name)
         os.environ[var] = new_path
         print(f"Updated environment variable {var}: {original_path} -> {new_path}")
 
+def _is_link(st):
+    """
+    Whether an lstat result is a symlink or a Windows junction.
+    """
+    if stat.S_ISLNK(st.st_mode):
+        return True
+    return (os.name == "nt" and stat.S_ISDIR(st.st_mode)
+            and bool(st.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT))
+
+def _fast_rmtree(path):
+    """
+    Deletes a directory tree bottom-up with os.scandir, using the cached
+    DirEntry types instead of a stat() per entry. Symlinks (and Windows
+    junctions) inside the tree are removed themselves, never followed; like
+    shutil.rmtree, path itself must not be a link.
+    """
+    if _is_link(os.stat(path, follow_symlinks=False)):
+        raise OSError("Cannot call rmtree on a symbolic link")
+    _rmtree_entries(path)
+
+def _rmtree_entries(path):
+    """
+    _fast_rmtree's recursive worker; path is known to be a real directory.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if (os.name == "nt" and entry.stat(follow_symlinks=False).st_file_attributes
+                        & stat.FILE_ATTRIBUTE_REPARSE_POINT):
+                    os.rmdir(entry.path)  # junction: remove the link, not its target
+                else:
+                    _rmtree_entries(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+def _remove_one(src):
+    """
+    Removes a single source file or directory tree. The source is stat-ed
+    here, not up front: by clean-up time it may have been replaced.
+    """
+    st = os.stat(src, follow_symlinks=False)
+    if _is_link(st):
+        # After create_symlinks the source is a link to the migrated copy:
+        # remove the link only, never what it points to
+        try:
+            os.unlink(src)
+        except (IsADirectoryError, PermissionError):
+            if os.name != "nt":
+                raise
+            os.rmdir(src)  # directory symlink or junction on Windows
+    elif stat.S_ISDIR(st.st_mode):
+        _fast_rmtree(src)
+    else:
+        src.unlink()
+    return src
+
 def clean_up(source_paths):
     """
     Cleans up the original files/directories after successful migration.
+    Sources are removed in parallel; a failure is reported and doesn't stop the others.
     """
-    for source in source_paths:
-        src = Path(source)
-        try:
-            if src.is_dir():
-                shutil.rmtree(src)
-            else:
-                src.unlink()
-            print(f"Cleaned up: {src}")
-        except Exception as e:
-            print(f"Error cleaning up {src}: {e}")
+    sources = [Path(source) for source in source_paths]
+    if not sources:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(sources))) as executor:
+        futures = {executor.submit(_remove_one, src): src for src in sources}
+        for future in as_completed(futures):
+            src = futures[future]
+            try:
+                future.result()
+                _log(f"Cleaned up: {src}")
+            except Exception as e:
+                _log(f"Error cleaning up {src}: {e}")
 
-def main():
-    # Prompt user for backup and migration paths
-    print("Backup and Migration Script")
-    backup_path = input("Enter the path for backups (e.g., a Google Drive mount): ").strip()
-    target_path = input("Enter the target path for migration (e.g., internal SSD): ").strip()
+def parse_args(argv=None):
+    """
+    Parses command-line options. Any of --backup-path, --target-path and
+    --sources left out is prompted for when stdin is a terminal; otherwise
+    it is an error, so the script never stalls waiting for input.
+    """
+    parser = argparse.ArgumentParser(description="Back up, migrate and symlink files to a new drive.")
+    parser.add_argument("--backup-path", help="Path for backups (e.g., a Google Drive mount)")
+    parser.add_argument("--target-path", help="Target path for migration (e.g., internal SSD)")
+    parser.add_argument("--sources", nargs="+", metavar="PATH", help="Paths to back up and migrate")
+    parser.add_argument("--env-var", action="append", default=[], metavar="VAR=PATH",
+                        help="Environment variable to repoint to the migrated PATH (repeatable)")
+    parser.add_argument("--archive", action="store_true",
+                        help="Back up into a single compressed tarball (zstd if available, else gzip)")
+    args = parser.parse_args(argv)
+
+    interactive = sys.stdin.isatty()
+    prompts = {
+        "backup_path": "Enter the path for backups (e.g., a Google Drive mount): ",
+        "target_path": "Enter the target path for migration (e.g., internal SSD): ",
+        "sources": "Enter the paths to back up and migrate (comma-separated): ",
+    }
+    for name, prompt in prompts.items():
+        if getattr(args, name):
+            continue
+        if not interactive:
+            parser.error(f"--{name.replace('_', '-')} is required when not running interactively")
+        value = input(prompt)
+        setattr(args, name, value.split(",") if name == "sources" else value.strip())
+
+    env_vars = {}
+    for item in args.env_var:
+        var, sep, path = item.partition("=")
+        if not sep or not var:
+            parser.error(f"--env-var must look like VAR=PATH, got {item!r}")
+        env_vars[var] = path
+    args.env_vars = env_vars
+    return args
 
-    # Get paths to back up and migrate
-    source_paths = input("Enter the paths to back up and migrate (comma-separated): ").split(",")
+def main(argv=None):
+    args = parse_args(argv)
+    print("Backup and Migration Script")
+    backup_path = args.backup_path
+    target_path = args.target_path
+    # Deduplicate once so symlinking and clean-up don't see a source twice either
+    source_paths = _unique_sources(args.sources)
+    # Stat each source once and share the results with the backup, migration
+    # and symlink phases (clean-up re-checks, as the sources change by then)
+    stats = _stat_sources(source_paths)
 
     # Backup Phase
     print("\nStarting backup...")
-    backup_dir = create_backup(source_paths, backup_path)
+    backup_dir = create_backup(source_paths, backup_path, stats, archive=args.archive)
     print(f"Backup completed: {backup_dir}\n")
 
     # Migration Phase
     print("Starting migration...")
-    target_dir = migrate_files(source_paths, target_path)
+    moved = set()
+    target_dir = migrate_files(source_paths, target_path, stats, moved)
     print(f"Migration completed: {target_dir}\n")
 
     # Create Symlinks
     print("Creating symbolic links...")
-    create_symlinks(source_paths, target_path)
+    create_symlinks(source_paths, target_path, stats)
 
     # Update Environment Variables
     print("Updating environment variables...")
-    env_vars = {
+    env_vars = args.env_vars or {
         # Replace with actual environment variables to update
         "EXAMPLE_VAR": source_paths[0]
     }
@@ -130,7 +610,8 @@ def main():
 
     # Clean Up
     print("Cleaning up original files...")
-    clean_up(source_paths)
+    # Renamed sources were moved, not copied, so there is no original left to remove
+    clean_up([src for src in source_paths if src not in moved])
 
     print("Process completed successfully!")
 
@@ -38,10 +38,165 @@ File Path:
     - network_diagnostic_tool.py (modifiable as needed)
 """
 
+import hashlib
+import json
+import os
 import platform
+import shutil
+import socket
+import struct
 import subprocess
 import sys
-from typing import List, Dict, Any
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:  # optional: read interface data in-process instead of via ip/ipconfig
+    psutil = None
+
+# Kernel IPv4 routing table on Linux; read directly instead of spawning `ip route`
+_PROC_NET_ROUTE = "/proc/net/route"
+
+# Optional on-disk report cache for repeated runs (e.g. a polling monitor).
+# Enabled with NETDIAG_CACHE=1; reports older than the TTL are regathered.
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "netdiag")
+_CACHE_TTL_SECONDS = 30
+
+# Environment passed to child processes: just enough to find binaries (and,
+# on Windows, the system directory), instead of copying all of os.environ.
+_MIN_ENV = {
+    key: os.environ[key]
+    for key in ("PATH", "SYSTEMROOT")
+    if key in os.environ
+}
+
+
+def _run(cmd: List[str]) -> str:
+    """
+    Runs a command and returns its combined stdout/stderr.
+
+    Raises:
+        subprocess.CalledProcessError: if the command exits non-zero.
+    """
+    return subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        check=True, text=True, env=_MIN_ENV,
+    ).stdout
+
+
+def _stream(cmd: List[str], timeout: float) -> Tuple[List[str], Optional[int]]:
+    """
+    Runs a command, collecting its output line by line as it is produced
+    rather than buffering it all at exit.
+
+    The process is killed if it runs longer than timeout seconds; the lines
+    read up to that point are still returned.
+
+    Returns:
+        Tuple[List[str], Optional[int]]: The output lines and the exit code,
+        or None as the exit code if the command timed out.
+    """
+    lines: List[str] = []
+    timed_out = threading.Event()
+
+    def _kill(proc: subprocess.Popen) -> None:
+        timed_out.set()
+        proc.kill()
+
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, bufsize=1, env=_MIN_ENV,
+    ) as proc:
+        # Reading stdout blocks until EOF, so enforce the deadline with a timer
+        timer = threading.Timer(timeout, _kill, args=(proc,))
+        timer.start()
+        try:
+            for line in proc.stdout:
+                lines.append(line.rstrip("\n"))
+        finally:
+            timer.cancel()
+        returncode = proc.wait()
+
+    return lines, None if timed_out.is_set() else returncode
+
+
+def _hex_to_ip(value: str) -> str:
+    """
+    Converts a little-endian hex address from /proc/net/route to dotted form.
+    """
+    return socket.inet_ntoa(struct.pack("<L", int(value, 16)))
+
+
+def _read_proc_routes() -> Optional[List[Dict[str, str]]]:
+    """
+    Reads the IPv4 routing table from /proc/net/route.
+
+    Returns:
+        Optional[List[Dict[str, str]]]: One dict per route (iface, destination,
+        gateway, prefix, metric), or None if the file isn't available.
+    """
+    try:
+        with open(_PROC_NET_ROUTE, "r", encoding="ascii") as f:
+            rows = f.read().splitlines()[1:]
+    except OSError:
+        return None
+
+    routes = []
+    for row in rows:
+        fields = row.split()
+        if len(fields) < 8:
+            continue
+        routes.append({
+            "iface": fields[0],
+            "destination": _hex_to_ip(fields[1]),
+            "gateway": _hex_to_ip(fields[2]),
+            "prefix": str(bin(int(fields[7], 16)).count("1")),
+            "metric": fields[6],
+        })
+    return routes
+
+
+def _format_routes(routes: List[Dict[str, str]]) -> str:
+    """
+    Formats routes from _read_proc_routes in the style of `ip route show`.
+    """
+    lines = []
+    for route in routes:
+        if route["prefix"] == "0":
+            line = "default"
+        else:
+            line = f"{route['destination']}/{route['prefix']}"
+        if route["gateway"] != "0.0.0.0":
+            line += f" via {route['gateway']}"
+        line += f" dev {route['iface']} metric {route['metric']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _psutil_ip_info() -> str:
+    """
+    Builds an interface/address listing from psutil (getifaddrs or
+    GetAdaptersAddresses under the hood), with no subprocess.
+    """
+    families = {socket.AF_INET: "inet", socket.AF_INET6: "inet6", psutil.AF_LINK: "link"}
+    if_stats = psutil.net_if_stats()
+    lines = []
+    for iface, addrs in psutil.net_if_addrs().items():
+        stats = if_stats.get(iface)
+        if stats is not None:
+            lines.append(f"{iface}: {'UP' if stats.isup else 'DOWN'} mtu {stats.mtu}")
+        else:
+            lines.append(f"{iface}:")
+        for addr in addrs:
+            line = f"    {families.get(addr.family, addr.family)} {addr.address}"
+            if addr.netmask:
+                line += f" netmask {addr.netmask}"
+            lines.append(line)
+    return "\n".join(lines)
 
 class NetworkDiagnosticTool:
     """
@@ -59,6 +214,20 @@ class NetworkDiagnosticTool:
         Detects the operating system and initializes a data structure for storing results.
         """
         self.os_type = platform.system()  # 'Windows', 'Linux', or 'Darwin' (for macOS)
+        self._is_windows = self.os_type == "Windows"
+        # Absolute paths of the commands we run, resolved once up front so each
+        # spawn skips the PATH search. Falls back to the bare name if not found.
+        self._bin: Dict[str, str] = {
+            name: self.which_command((name,)) or name
+            for name in ("ipconfig", "ifconfig", "ip", "route", "netstat", "arp", "ping")
+        }
+        # Results of ping/traceroute runs, keyed by (probe, host)
+        self._probe_cache: Dict[Tuple[str, str], str] = {}
+        # Output of commands shared by several gather steps (`ipconfig /all`,
+        # `route print`, `ip route show`), keyed by argv. Futures let a step
+        # that runs concurrently wait for the first run instead of spawning again.
+        self._cmd_cache: Dict[Tuple[str, ...], Future] = {}
+        self._cmd_cache_lock = threading.Lock()
         self.report_data: Dict[str, Any] = {
             "os_type": self.os_type,
             "ip_info": "",
@@ -72,24 +241,29 @@ class NetworkDiagnosticTool:
     def gather_ip_info(self) -> None:
         """
         Gathers IP configuration details (IP addresses, subnet masks, etc.).
-        Updates self.report_data['ip_info'] with the command output.
+        Updates self.report_data['ip_info'] with the command output, or with
+        psutil's interface listing when psutil is installed.
         
         Raises:
             subprocess.CalledProcessError: if the command fails to run.
         """
+        if psutil is not None:
+            self.report_data["ip_info"] = _psutil_ip_info()
+            return
+
         try:
-            if self.os_type == "Windows":
-                cmd = ["ipconfig", "/all"]
+            if self._is_windows:
+                cmd = [self._bin["ipconfig"], "/all"]
             else:
                 # For Linux / macOS, prefer `ip addr`; fallback to `ifconfig`
                 # if `ip` is not available
-                ip_cmd = self.which_command(["ip"])
+                ip_cmd = self.which_command(("ip",))
                 if ip_cmd:
                     cmd = [ip_cmd, "addr", "show"]
                 else:
-                    cmd = ["ifconfig"]
+                    cmd = [self._bin["ifconfig"]]
 
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+            result = self._run_cached(cmd)
             self.report_data["ip_info"] = result.strip()
         
         except subprocess.CalledProcessError as e:
@@ -99,23 +273,32 @@ class NetworkDiagnosticTool:
         """
         Retrieves default gateway information and routing details.
         Updates self.report_data['gateway_info'].
+        On Linux the default routes are read straight from /proc/net/route.
 
         Raises:
             subprocess.CalledProcessError: if the command fails to run.
         """
+        routes = None if self._is_windows else _read_proc_routes()
+        if routes is not None:
+            default_routes = [route for route in routes if route["prefix"] == "0"]
+            self.report_data["gateway_info"] = (
+                _format_routes(default_routes) or "No default gateway configured."
+            )
+            return
+
         try:
-            if self.os_type == "Windows":
+            if self._is_windows:
                 # On Windows, `ipconfig` shows gateway, but `route print` is more explicit
-                cmd = ["route", "print"]
+                cmd = [self._bin["route"], "print"]
             else:
                 # On Linux / macOS, use `ip route`; fallback to `netstat -rn`
-                ip_cmd = self.which_command(["ip"])
+                ip_cmd = self.which_command(("ip",))
                 if ip_cmd:
                     cmd = [ip_cmd, "route", "show"]
                 else:
-                    cmd = ["netstat", "-rn"]
+                    cmd = [self._bin["netstat"], "-rn"]
 
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+            result = self._run_cached(cmd)
             self.report_data["gateway_info"] = result.strip()
         
         except subprocess.CalledProcessError as e:
@@ -131,11 +314,11 @@ class NetworkDiagnosticTool:
             OSError: if reading /etc/resolv.conf fails.
         """
         try:
-            if self.os_type == "Windows":
+            if self._is_windows:
                 # We can parse DNS from the same ipconfig /all output.
                 # For brevity, reuse the IP info if needed or call again
-                cmd = ["ipconfig", "/all"]
-                result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+                cmd = [self._bin["ipconfig"], "/all"]
+                result = self._run_cached(cmd)
                 # Optionally parse for "DNS Servers" lines. For now, store raw output.
                 self.report_data["dns_info"] = result.strip()
 
@@ -161,12 +344,12 @@ class NetworkDiagnosticTool:
             subprocess.CalledProcessError: if the command fails to run.
         """
         try:
-            if self.os_type == "Windows":
-                cmd = ["arp", "-a"]
+            if self._is_windows:
+                cmd = [self._bin["arp"], "-a"]
             else:
-                cmd = ["arp", "-a"]
+                cmd = [self._bin["arp"], "-a"]
             
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+            result = _run(cmd)
             self.report_data["arp_table"] = result.strip()
         
         except subprocess.CalledProcessError as e:
@@ -176,22 +359,28 @@ class NetworkDiagnosticTool:
         """
         Gathers the system's routing table for advanced troubleshooting.
         On Windows, `route print` also reveals this info, 
-        but we separate it for clarity. On Linux/macOS, `netstat -rn` or `ip route show`.
+        but we separate it for clarity. On Linux/macOS, `netstat -rn` or `ip route show`;
+        on Linux the table is read from /proc/net/route when available.
 
         Raises:
             subprocess.CalledProcessError: if the command fails to run.
         """
+        routes = None if self._is_windows else _read_proc_routes()
+        if routes is not None:
+            self.report_data["routing_table"] = _format_routes(routes)
+            return
+
         try:
-            if self.os_type == "Windows":
-                cmd = ["route", "print"]
+            if self._is_windows:
+                cmd = [self._bin["route"], "print"]
             else:
-                ip_cmd = self.which_command(["ip"])
+                ip_cmd = self.which_command(("ip",))
                 if ip_cmd:
                     cmd = [ip_cmd, "route", "show"]
                 else:
-                    cmd = ["netstat", "-rn"]
+                    cmd = [self._bin["netstat"], "-rn"]
 
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+            result = self._run_cached(cmd)
             self.report_data["routing_table"] = result.strip()
         
         except subprocess.CalledProcessError as e:
@@ -222,66 +411,114 @@ class NetworkDiagnosticTool:
 
         self.report_data["additional_checks"] = checks_output
 
-    def _ping_test(self, host: str) -> str:
+    def _run_cached(self, cmd: List[str]) -> str:
+        """
+        Like _run, but each distinct command runs at most once per tool
+        instance; later (or concurrent) callers get the same output.
+
+        Raises:
+            subprocess.CalledProcessError: if the command exits non-zero.
+        """
+        key = tuple(cmd)
+        with self._cmd_cache_lock:
+            future = self._cmd_cache.get(key)
+            owner = future is None
+            if owner:
+                future = self._cmd_cache[key] = Future()
+
+        if owner:
+            try:
+                future.set_result(_run(cmd))
+            except BaseException as e:
+                future.set_exception(e)
+        return future.result()
+
+    def _ping_test(self, host: str, timeout: float = 10) -> str:
         """
         Private helper to ping a specified host and return the command output.
+        Results are cached per host, so repeated checks don't re-run ping.
+        Output is read as it arrives; if ping runs past timeout seconds it is
+        stopped and the partial output is returned.
         
         Args:
             host (str): The host or IP to ping.
+            timeout (float): Seconds to wait for ping to finish.
 
         Returns:
             str: The raw output of the ping command or an error message.
         """
-        try:
-            if self.os_type == "Windows":
-                cmd = ["ping", "-n", "4", host]
-            else:
-                cmd = ["ping", "-c", "4", host]
-
-            output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
-            return f"Ping Test to {host}:\n{output}"
-        
-        except subprocess.CalledProcessError as e:
-            return f"Error performing ping to {host}: {e.output}"
-
-    def _traceroute_test(self, host: str) -> str:
+        cache_key = ("ping", host)
+        if cache_key in self._probe_cache:
+            return self._probe_cache[cache_key]
+
+        if self._is_windows:
+            cmd = [self._bin["ping"], "-n", "4", host]
+        else:
+            cmd = [self._bin["ping"], "-c", "4", host]
+
+        lines, returncode = _stream(cmd, timeout)
+        if returncode is None:
+            lines = [f"Ping Test to {host} (timed out after {timeout}s):"] + lines
+        elif returncode == 0:
+            lines = [f"Ping Test to {host}:"] + lines
+        else:
+            lines = [f"Error performing ping to {host}:"] + lines
+        result = "\n".join(lines)
+
+        self._probe_cache[cache_key] = result
+        return result
+
+    def _traceroute_test(self, host: str, timeout: float = 60) -> str:
         """
         Private helper to run traceroute (or tracert on Windows) to the given host.
+        Results are cached per host, so repeated checks don't re-run traceroute.
+        Output is read hop by hop; if the trace runs past timeout seconds it is
+        stopped and the hops seen so far are returned.
         
         Args:
             host (str): The host or IP to trace to.
+            timeout (float): Seconds to wait for the trace to finish.
 
         Returns:
             str: The raw output of the traceroute command or an error message.
         """
-        trace_cmd = "tracert" if self.os_type == "Windows" else "traceroute"
+        cache_key = ("traceroute", host)
+        if cache_key in self._probe_cache:
+            return self._probe_cache[cache_key]
+
+        trace_cmd = "tracert" if self._is_windows else "traceroute"
         
         # It's possible that 'traceroute' isn't installed by default on some systems.
         # We can try to detect it or just catch errors.
-        try:
-            cmd_path = self.which_command([trace_cmd])
-            if cmd_path is None:
-                return f"{trace_cmd} is not installed or not found in PATH."
+        cmd_path = self.which_command((trace_cmd,))
+        if cmd_path is None:
+            result = f"{trace_cmd} is not installed or not found in PATH."
+        else:
+            lines, returncode = _stream([cmd_path, host], timeout)
+            if returncode is None:
+                lines = [f"{trace_cmd.capitalize()} to {host} (timed out after {timeout}s):"] + lines
+            elif returncode == 0:
+                lines = [f"{trace_cmd.capitalize()} to {host}:"] + lines
             else:
-                cmd = [cmd_path, host]
-                output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
-                return f"{trace_cmd.capitalize()} to {host}:\n{output}"
-        except subprocess.CalledProcessError as e:
-            return f"Error performing {trace_cmd} to {host}: {e.output}"
+                lines = [f"Error performing {trace_cmd} to {host}:"] + lines
+            result = "\n".join(lines)
+
+        self._probe_cache[cache_key] = result
+        return result
 
     @staticmethod
-    def which_command(commands: List[str]) -> str:
+    @lru_cache(maxsize=None)
+    def which_command(commands: Tuple[str, ...]) -> Optional[str]:
         """
         Utility function to check if any of the provided commands exist in the PATH.
+        Results are cached, since PATH lookups don't change during a run.
         
         Args:
-            commands (List[str]): A list of command names to check.
+            commands (Tuple[str, ...]): A tuple of command names to check.
 
         Returns:
             str: The first command found in PATH, or None if none are found.
         """
-        import shutil
-
         for cmd in commands:
             found_path = shutil.which(cmd)
             if found_path is not None:
@@ -292,41 +529,113 @@ class NetworkDiagnosticTool:
         """
         Prints a comprehensive, formatted report of all diagnostic data
         stored in self.report_data.
+        The report is assembled in memory and written to stdout in one call.
         """
-        print("==============================================================")
-        print("        Network Diagnostic Tool - Summary Report             ")
-        print("==============================================================")
-        print(f"Operating System Detected: {self.report_data['os_type']}")
-        print("\n---------------------- IP Configuration ----------------------")
-        print(self.report_data["ip_info"])
-        print("\n---------------------- Default Gateway -----------------------")
-        print(self.report_data["gateway_info"])
-        print("\n---------------------- DNS Information -----------------------")
-        print(self.report_data["dns_info"])
-        print("\n--------------------- ARP (MAC Table) ------------------------")
-        print(self.report_data["arp_table"])
-        print("\n-------------------- Routing Table ---------------------------")
-        print(self.report_data["routing_table"])
-        print("\n----------------- Additional Diagnostic Checks --------------")
+        lines = [
+            "==============================================================",
+            "        Network Diagnostic Tool - Summary Report             ",
+            "==============================================================",
+            f"Operating System Detected: {self.report_data['os_type']}",
+            "\n---------------------- IP Configuration ----------------------",
+            self.report_data["ip_info"],
+            "\n---------------------- Default Gateway -----------------------",
+            self.report_data["gateway_info"],
+            "\n---------------------- DNS Information -----------------------",
+            self.report_data["dns_info"],
+            "\n--------------------- ARP (MAC Table) ------------------------",
+            self.report_data["arp_table"],
+            "\n-------------------- Routing Table ---------------------------",
+            self.report_data["routing_table"],
+            "\n----------------- Additional Diagnostic Checks --------------",
+        ]
         for idx, item in enumerate(self.report_data["additional_checks"], 1):
-            print(f"Check #{idx}:\n{item}\n")
-        print("==============================================================")
-        print("End of Network Diagnostic Report\n")
+            lines.append(f"Check #{idx}:\n{item}\n")
+        lines.append("==============================================================")
+        lines.append("End of Network Diagnostic Report\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _cache_path(self) -> str:
+        """
+        Path of the cached report for this OS and set of network interfaces,
+        so adding or removing an interface invalidates the cache.
+        """
+        try:
+            interfaces = sorted(name for _, name in socket.if_nameindex())
+        except OSError:
+            interfaces = []
+        key = hashlib.sha1((self.os_type + str(interfaces)).encode()).hexdigest()
+        return os.path.join(_CACHE_DIR, f"{key}.json")
+
+    def _load_cached_report(self) -> bool:
+        """
+        Loads report_data from the disk cache if a fresh entry exists.
+
+        Returns:
+            bool: True if report_data was loaded from the cache.
+        """
+        path = self._cache_path()
+        try:
+            if time.time() - os.path.getmtime(path) >= _CACHE_TTL_SECONDS:
+                return False
+            with open(path, "r", encoding="utf-8") as f:
+                self.report_data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def _save_cached_report(self) -> None:
+        """
+        Writes report_data to the disk cache. Failures are ignored, since the
+        cache is only an optimization.
+        """
+        path = self._cache_path()
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.report_data, f)
+        except OSError:
+            pass
 
     def run_all_diagnostics(self) -> None:
         """
-        Higher-level method to run all diagnostic functions in sequence 
-        and then produce a report.
+        Higher-level method to run all diagnostic functions and then produce a report.
+
+        The gather steps and the ping/traceroute probes don't depend on each
+        other, so they run concurrently in a thread pool; total time is about
+        that of the slowest command. Each gather step writes its own
+        report_data key, so no locking is needed.
+        
+        With NETDIAG_CACHE=1 set, a report gathered less than
+        _CACHE_TTL_SECONDS ago is reused from ~/.cache/netdiag instead.
         
         This is where you can add or remove diagnostic steps to customize 
         your data collection logic.
         """
-        self.gather_ip_info()
-        self.gather_gateway_info()
-        self.gather_dns_info()
-        self.gather_arp_table()
-        self.gather_routing_table()
-        self.perform_additional_checks()
+        use_cache = os.environ.get("NETDIAG_CACHE") == "1"
+        if use_cache and self._load_cached_report():
+            self.generate_report()
+            return
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            gather_futures = [
+                executor.submit(self.gather_ip_info),
+                executor.submit(self.gather_gateway_info),
+                executor.submit(self.gather_dns_info),
+                executor.submit(self.gather_arp_table),
+                executor.submit(self.gather_routing_table),
+            ]
+            # Same probes as perform_additional_checks, kept in that order
+            check_futures = [
+                executor.submit(self._ping_test, "8.8.8.8"),
+                executor.submit(self._traceroute_test, "8.8.8.8"),
+            ]
+            wait(gather_futures + check_futures)
+
+        for future in gather_futures:
+            future.result()  # re-raise any unexpected error from a gather step
+        self.report_data["additional_checks"] = [future.result() for future in check_futures]
+        if use_cache:
+            self._save_cached_report()
         self.generate_report()
 
 
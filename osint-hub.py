@@ -1,38 +1,160 @@
+import concurrent.futures
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import re
 import socket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import whois
 import dns.resolver
 from datetime import datetime
 import threading
+from collections import deque
 import csv
 import os
 import time
+from functools import lru_cache
 import plotly.graph_objects as go
 import shodan
 from virus_total_apis import PublicApi as VirusTotalAPI
 import phonenumbers
 from phonenumbers import carrier, geocoder, timezone
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from requests_html import HTMLSession
 import pandas as pd
 
-class RateLimiter:
-    def __init__(self, calls_per_second=1):
-        self.calls_per_second = calls_per_second
-        self.last_call = 0
-        
-    def wait(self):
-        """Wait if necessary to respect rate limits"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call
-        if time_since_last_call < 1.0 / self.calls_per_second:
-            time.sleep((1.0 / self.calls_per_second) - time_since_last_call)
-        self.last_call = time.time()
+try:
+    import orjson
+except ImportError:  # optional, faster JSON parser/encoder
+    orjson = None
+
+CONFIG_FILE = 'config.json'
+
+# Parsed config file contents, keyed on path, with the mtime they were read at
+_config_cache = {}
+
+def _read_config(path=CONFIG_FILE):
+    """Return the parsed config file, re-reading it only when its mtime changes"""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+        
+    with open(path, 'rb') as f:
+        data = f.read()
+    config = orjson.loads(data) if orjson is not None else json.loads(data)
+    _config_cache[path] = (mtime, config)
+    return config
+
+class TokenBucket:
+    def __init__(self, rate, capacity=1):
+        self.rate = rate  # tokens added per second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def reserve(self):
+        """
+        Take one token without blocking and return the seconds to wait before
+        using it (0 if one was available). Bursts up to capacity pass without waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # Reserve the token now (possibly going negative) so successive
+            # callers queue up behind each other instead of all going at once
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0
+
+# Seconds to keep search results; "not found" answers expire sooner so new
+# breaches or scans show up quickly
+CACHE_TTL = 600
+NEGATIVE_CACHE_TTL = 60
+
+# API hosts contacted at startup so DNS and the HTTP pool are warm for the first
+# search. Only hosts queried through self.http belong here: the Shodan and
+# VirusTotal clients open their own connections, so warming them is wasted traffic
+PREWARM_URLS = (
+    'https://haveibeenpwned.com/',
+)
+
+# Display names for phonenumbers.PhoneNumberType values, built once
+_PHONE_TYPE_NAMES = {
+    phonenumbers.PhoneNumberType.MOBILE: "Mobile",
+    phonenumbers.PhoneNumberType.FIXED_LINE: "Fixed Line",
+    phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: "Fixed Line or Mobile",
+    phonenumbers.PhoneNumberType.TOLL_FREE: "Toll Free",
+    phonenumbers.PhoneNumberType.PREMIUM_RATE: "Premium Rate",
+    phonenumbers.PhoneNumberType.SHARED_COST: "Shared Cost",
+    phonenumbers.PhoneNumberType.VOIP: "VoIP",
+    phonenumbers.PhoneNumberType.PERSONAL_NUMBER: "Personal Number",
+    phonenumbers.PhoneNumberType.PAGER: "Pager",
+    phonenumbers.PhoneNumberType.UAN: "UAN",
+    phonenumbers.PhoneNumberType.UNKNOWN: "Unknown"
+}
+
+@lru_cache(maxsize=256)
+def _phone_details(phone_number):
+    """
+    Parse a phone number and look up its metadata, memoized per number string.
+    Returns (valid, country, carrier, timezones, type name); raises
+    phonenumbers.NumberParseException for unparseable input (not cached).
+    """
+    parsed = phonenumbers.parse(phone_number)
+    return (
+        phonenumbers.is_valid_number(parsed),
+        geocoder.description_for_number(parsed, 'en'),
+        carrier.name_for_number(parsed, 'en'),
+        tuple(timezone.time_zones_for_number(parsed)),
+        _PHONE_TYPE_NAMES.get(phonenumbers.number_type(parsed), 'Unknown')
+    )
+
+# Most recent API response times kept for the timeline plot
+MAX_PLOT_POINTS = 500
+
+# Most IPs Shodan's host endpoint accepts in one call
+SHODAN_BATCH_SIZE = 100
+
+class TTLCache:
+    def __init__(self, maxsize=1024, ttl=CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = {}  # key -> (expires_at, value), oldest first
+        self._lock = threading.Lock()
+        
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+            
+    def set(self, key, value, ttl=None):
+        """Store value under key for ttl seconds (the cache default if None)"""
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            
+    def __contains__(self, key):
+        """Whether key has an unexpired value, without counting a hit or miss"""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[0] > time.monotonic()
 
 class OSINTHub:
     def __init__(self, root):
@@ -40,13 +162,52 @@ class OSINTHub:
         self.root.title("OSINT Research Hub")
         self.root.geometry("1024x768")
         
-        # Initialize rate limiter
-        self.rate_limiter = RateLimiter()
+        # Per-API rate limits (Shodan 1/s, VirusTotal public API 4/min, HIBP 1 per 1.5s)
+        self.buckets = {
+            'shodan': TokenBucket(1, 2),
+            'virustotal': TokenBucket(4 / 60, 4),
+            'haveibeenpwned': TokenBucket(1 / 1.5, 1)
+        }
+        
+        # Cache of search results keyed on (api, target)
+        self.cache = TTLCache()
+        
+        # Small, reused pool for the searches. Rate limits are waited out on
+        # the Tk side before a search is submitted (see _schedule), so a
+        # worker is never tied up sleeping on a token bucket
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='osint')
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Set by on_close; workers finishing afterwards must not touch Tk
+        self._closed = False
+        # root.after ids of searches still waiting for a rate-limit token, and
+        # the futures of submitted ones, so a new run can cancel them
+        self._scheduled = set()
+        self._futures = set()
+        # Bumped by each search_all; results from an earlier run are dropped
+        self._run_id = 0
+        
+        # Lookups currently in progress, keyed like the cache, so identical
+        # concurrent queries share one request
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Shared HTTP session: keeps TCP/TLS connections alive between searches
+        # and retries transient failures with backoff
+        self.http = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        self.http.headers.update({'User-Agent': 'OSINT Research Hub'})
+        threading.Thread(target=self._prewarm, daemon=True).start()
         
         # Create main notebook for tabs
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(expand=True, fill='both', padx=5, pady=5)
         
+        # Load API keys first: the configuration tab fills its entries from them
+        self.load_config()
+        
         # Initialize tabs
         self.setup_input_tab()
         self.setup_results_tab()
@@ -55,14 +216,19 @@ class OSINTHub:
         
         # Initialize results storage
         self.results = {}
-        self.load_config()
         
+    def _prewarm(self):
+        """Resolve and connect to the self.http API hosts in the background, ignoring any errors"""
+        for url in PREWARM_URLS:
+            try:
+                self.http.head(url, timeout=3)
+            except requests.RequestException:
+                pass
+                
     def load_config(self):
         """Load API keys from configuration file"""
         try:
-            with open('config.json', 'r') as f:
-                config = json.load(f)
-                self.api_keys = config.get('api_keys', {})
+            self.api_keys = dict(_read_config().get('api_keys', {}))
         except FileNotFoundError:
             self.api_keys = {}
     
@@ -71,8 +237,12 @@ class OSINTHub:
         config = {
             'api_keys': {k: v.get() for k, v in self.api_key_entries.items()}
         }
-        with open('config.json', 'w') as f:
-            json.dump(config, f)
+        if orjson is not None:
+            with open(CONFIG_FILE, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(CONFIG_FILE, 'w') as f:
+                json.dump(config, f, indent=2)
         messagebox.showinfo("Success", "Configuration saved successfully!")
         
     def setup_input_tab(self):
@@ -118,6 +288,14 @@ class OSINTHub:
         self.progress = ttk.Progressbar(input_frame, length=300, mode='determinate')
         self.progress.grid(row=6, column=0, columnspan=2, pady=10)
         
+    def setup_results_tab(self):
+        """Setup the results tab"""
+        results_frame = ttk.Frame(self.notebook)
+        self.notebook.add(results_frame, text="Results")
+        
+        self.results_text = scrolledtext.ScrolledText(results_frame, wrap=tk.WORD)
+        self.results_text.pack(expand=True, fill='both', padx=5, pady=5)
+        
     def setup_visualization_tab(self):
         """Setup the visualization tab"""
         viz_frame = ttk.Frame(self.notebook)
@@ -128,6 +306,38 @@ class OSINTHub:
         self.canvas = FigureCanvasTkAgg(self.fig, master=viz_frame)
         self.canvas.get_tk_widget().pack(expand=True, fill='both')
         
+        # Build the axes and artists once; create_visualizations only updates their data
+        self.axs = self.fig.subplots(2, 1)
+        
+        # Top plot: API Response Timeline (bounded, newest MAX_PLOT_POINTS responses)
+        self._timestamps = deque(maxlen=MAX_PLOT_POINTS)
+        self._response_times = deque(maxlen=MAX_PLOT_POINTS)
+        self._line, = self.axs[0].plot([], [], 'bo-', animated=True)
+        self.axs[0].xaxis_date()
+        self.axs[0].set_title('API Response Times')
+        self.axs[0].set_xlabel('Time')
+        self.axs[0].set_ylabel('Response Time (s)')
+        self.axs[0].tick_params(axis='x', rotation=45)
+        
+        # Bottom plot: Data Sources Distribution
+        self._bars = None
+        self._bar_sources = []
+        self.axs[1].set_title('Data Sources Distribution')
+        self.axs[1].set_xlabel('Source')
+        self.axs[1].set_ylabel('Number of Results')
+        self.axs[1].tick_params(axis='x', rotation=45)
+        
+        # The timeline line is animated (left out of full draws) and blitted
+        # onto a saved background, which is refreshed after every full draw
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.fig.tight_layout()
+        
+    def _on_draw(self, event):
+        """Save the freshly drawn background and draw the animated line over it"""
+        self._background = self.canvas.copy_from_bbox(self.axs[0].bbox)
+        self.axs[0].draw_artist(self._line)
+        
     def setup_config_tab(self):
         config_frame = ttk.Frame(self.notebook)
         self.notebook.add(config_frame, text="Configuration")
@@ -154,28 +364,256 @@ class OSINTHub:
         # Save configuration button
         ttk.Button(config_frame, text="Save Configuration", command=self.save_config).pack(pady=10)
         
+        # Cache metrics
+        self.cache_stats = tk.StringVar()
+        ttk.Label(config_frame, textvariable=self.cache_stats).pack(pady=5)
+        self.update_cache_stats()
+        
+    def update_cache_stats(self):
+        """Refresh the cache hit/miss counters on the configuration tab"""
+        self.cache_stats.set(f"Result cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        
+    def validate_ip(self, value):
+        """Check whether a string is a valid IPv4 or IPv6 address"""
+        for family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                socket.inet_pton(family, value)
+                return True
+            except (OSError, ValueError):
+                pass
+        return False
+        
+    def search_all(self):
+        """Run all enabled searches concurrently without blocking the Tk mainloop"""
+        # Tk widgets must only be touched from the main thread, so read every
+        # input here and hand plain values to the workers.
+        self.api_keys.update({k: v.get() for k, v in self.api_key_entries.items()})
+        ip = self.ip_entry.get().strip()
+        email = self.email_entry.get().strip()
+        phone = self.phone_entry.get().strip()
+        
+        # Several IPs may be given, separated by commas or spaces
+        ips = list(dict.fromkeys(value for value in re.split(r'[,\s]+', ip) if value))
+        
+        jobs = []
+        if len(ips) == 1 and self.use_shodan.get():
+            jobs.append(('Shodan', self.search_shodan, ips[0]))
+        elif ips and self.use_shodan.get():
+            # One job per API call, so each takes a single rate-limit token
+            jobs.extend(('Shodan', self.search_shodan_bulk, ips[start:start + SHODAN_BATCH_SIZE])
+                        for start in range(0, len(ips), SHODAN_BATCH_SIZE))
+        if self.use_virustotal.get():
+            jobs.extend(('VirusTotal', self.search_virustotal, value) for value in ips)
+        if email and self.use_haveibeenpwned.get():
+            jobs.append(('HaveIBeenPwned', self.search_haveibeenpwned, email))
+        if phone:
+            jobs.append(('Phone', self.analyze_phone, phone))
+            
+        if not jobs:
+            messagebox.showwarning("No Input", "Enter an email, phone number or IP address to search.")
+            return
+            
+        # Start afresh: the previous run's searches must not add to this one's
+        # results or progress
+        self._cancel_pending()
+        self._run_id += 1
+        self.results_text.delete('1.0', tk.END)
+        self.progress['maximum'] = len(jobs)
+        self.progress['value'] = 0
+        
+        # Searches run concurrently on the pool, so total time is that of the
+        # slowest API rather than the sum; results come back to Tk via root.after
+        for name, search, target in jobs:
+            self._schedule(name, search, target)
+            
+    def _schedule(self, name, search, target):
+        """
+        Submit a search once its API's rate limit allows (runs on the Tk thread).
+        The wait is a root.after timer rather than a sleep in a worker, so a
+        backlog for one API can't hold up the others. Searches answered from
+        the cache, or without an API key, don't take a token.
+        """
+        bucket = self.buckets.get(name.lower())
+        targets = target if isinstance(target, list) else [target]
+        delay = 0
+        if bucket is not None and self.api_keys.get(name) and any(
+                (name.lower(), value.lower()) not in self.cache for value in targets):
+            delay = bucket.reserve()
+        if not delay:
+            self._submit(name, search, target)
+            return
+            
+        def fire():
+            self._scheduled.discard(after_id)
+            self._submit(name, search, target)
+        after_id = self.root.after(int(delay * 1000), fire)
+        self._scheduled.add(after_id)
+        
+    def _submit(self, name, search, target):
+        """Run a search on the pool, handing its result back to the Tk thread"""
+        if self._closed:
+            return
+        future = self.pool.submit(self._timed_search, search, target)
+        self._futures.add(future)
+        future.add_done_callback(
+            lambda f, name=name, run_id=self._run_id: self._after(0, self._search_done, name, f, run_id)
+        )
+        
+    def _cancel_pending(self):
+        """Cancel searches still waiting for a token or a worker (runs on the Tk thread)"""
+        for after_id in self._scheduled:
+            self.root.after_cancel(after_id)
+        self._scheduled.clear()
+        for future in self._futures:
+            future.cancel()  # no-op for searches already running
+        self._futures.clear()
+        
+    def _after(self, delay_ms, func, *args):
+        """root.after for worker threads: a no-op once the window is closing or gone"""
+        if self._closed:
+            return
+        try:
+            self.root.after(delay_ms, func, *args)
+        except (tk.TclError, RuntimeError):
+            pass  # destroyed between the check and the call
+            
+    @staticmethod
+    def _timed_search(search, target):
+        """Run one search in a worker, returning (text, seconds taken)"""
+        start = time.time()
+        text = search(target)
+        return text, time.time() - start
+        
+    def _search_done(self, name, future, run_id):
+        """Unpack a finished search future (runs on the Tk thread)"""
+        self._futures.discard(future)
+        if run_id != self._run_id:
+            return  # from a run that a newer search_all replaced
+        try:
+            text, response_time = future.result()
+        except Exception as e:
+            text, response_time = f"Error in {name} search: {str(e)}", 0.0
+        self._search_finished(name, text, response_time)
+        
+    def on_close(self):
+        """Stop pending searches and close the window"""
+        self._closed = True
+        self._cancel_pending()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.http.close()
+        self.root.destroy()
+        
+    def _search_finished(self, name, text, response_time):
+        """Show one search result and record its timing (runs on the Tk thread)"""
+        self.results_text.insert(tk.END, text + "\n\n")
+        
+        self._timestamps.append(mdates.date2num(datetime.now()))
+        self._response_times.append(response_time)
+        data_sources = self.results.setdefault('data_sources', {})
+        data_sources[name] = data_sources.get(name, 0) + 1
+        
+        self.update_cache_stats()
+        self.progress['value'] += 1
+        if self.progress['value'] >= self.progress['maximum']:
+            self.create_visualizations()
+            
+    def _single_flight(self, key, compute):
+        """Run compute() for key, or wait for and share the result of an identical call already running"""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = concurrent.futures.Future()
+                
+        if not owner:
+            return future.result()
+            
+        try:
+            result = compute()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+                
+    def _format_shodan_host(self, host):
+        """Format a Shodan host record for the results tab"""
+        results = []
+        results.append("=== Shodan Results ===")
+        results.append(f"Organization: {host.get('org', 'N/A')}")
+        results.append(f"Operating System: {host.get('os', 'N/A')}")
+        results.append(f"Open Ports: {', '.join(map(str, host.get('ports', [])))}")
+        
+        # Add services information
+        results.append("\nServices:")
+        for service in host.get('data', []):
+            results.append(f"Port {service.get('port')}: {service.get('product', 'N/A')}")
+            
+        return "\n".join(results)
+        
+    def search_shodan_bulk(self, ips):
+        """
+        Search Shodan for several IPs, up to SHODAN_BATCH_SIZE per API call.
+        search_all passes one batch at a time, so each call is rate-limited once.
+        """
+        api_key = self.api_keys.get('Shodan', '')
+        
+        if not api_key:
+            return "Shodan API key not configured"
+            
+        ips = list(dict.fromkeys(ips))  # drop repeats, keep order
+        sections = {}
+        pending = []
+        for ip in ips:
+            cached = self.cache.get(('shodan', ip.lower()))
+            if cached is not None:
+                sections[ip] = cached
+            else:
+                pending.append(ip)
+                
+        api = shodan.Shodan(api_key)
+        for start in range(0, len(pending), SHODAN_BATCH_SIZE):
+            batch = pending[start:start + SHODAN_BATCH_SIZE]
+            try:
+                hosts = api.host(batch)
+                if isinstance(hosts, dict):
+                    hosts = [hosts]
+                by_ip = {host.get('ip_str'): host for host in hosts}
+                for ip in batch:
+                    host = by_ip.get(ip)
+                    if host is None:
+                        sections[ip] = "No information available"
+                        continue
+                    sections[ip] = self._format_shodan_host(host)
+                    self.cache.set(('shodan', ip.lower()), sections[ip])
+            except Exception as e:
+                for ip in batch:
+                    sections[ip] = f"Error in Shodan search: {str(e)}"
+                    
+        return "\n\n".join(f"--- {ip} ---\n{sections[ip]}" for ip in ips)
+        
     def search_shodan(self, ip):
         """Search Shodan for IP information"""
         results = []
-        api_key = self.api_key_entries['Shodan'].get()
+        api_key = self.api_keys.get('Shodan', '')
         
         if not api_key:
             return "Shodan API key not configured"
             
+        key = ('shodan', ip.lower())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+            
         try:
             api = shodan.Shodan(api_key)
             host = api.host(ip)
             
-            results.append("=== Shodan Results ===")
-            results.append(f"Organization: {host.get('org', 'N/A')}")
-            results.append(f"Operating System: {host.get('os', 'N/A')}")
-            results.append(f"Open Ports: {', '.join(map(str, host.get('ports', [])))}")
-            
-            # Add services information
-            results.append("\nServices:")
-            for service in host.get('data', []):
-                results.append(f"Port {service.get('port')}: {service.get('product', 'N/A')}")
-                
+            results.append(self._format_shodan_host(host))
+            self.cache.set(key, "\n".join(results))
         except Exception as e:
             results.append(f"Error in Shodan search: {str(e)}")
             
@@ -184,11 +622,16 @@ class OSINTHub:
     def search_virustotal(self, ip_or_domain):
         """Search VirusTotal for IP or domain information"""
         results = []
-        api_key = self.api_key_entries['VirusTotal'].get()
+        api_key = self.api_keys.get('VirusTotal', '')
         
         if not api_key:
             return "VirusTotal API key not configured"
             
+        key = ('virustotal', ip_or_domain.lower())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+            
         try:
             vt = VirusTotalAPI(api_key)
             
@@ -208,6 +651,7 @@ class OSINTHub:
                     for scanner, result in response['scans'].items():
                         if result.get('detected'):
                             results.append(f"{scanner}: {result.get('result', 'N/A')}")
+                self.cache.set(key, "\n".join(results))
                             
         except Exception as e:
             results.append(f"Error in VirusTotal search: {str(e)}")
@@ -216,19 +660,28 @@ class OSINTHub:
         
     def search_haveibeenpwned(self, email):
         """Search HaveIBeenPwned for email breach information"""
-        results = []
-        api_key = self.api_key_entries['HaveIBeenPwned'].get()
+        api_key = self.api_keys.get('HaveIBeenPwned', '')
         
         if not api_key:
             return "HaveIBeenPwned API key not configured"
             
+        key = ('haveibeenpwned', email.lower())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+            
+        # HIBP has no bulk endpoint, so just collapse concurrent identical lookups
+        return self._single_flight(key, lambda: self._query_haveibeenpwned(email, api_key, key))
+        
+    def _query_haveibeenpwned(self, email, api_key, key):
+        """Query the HIBP breachedaccount endpoint and cache the formatted result"""
+        results = []
         headers = {
-            'hibp-api-key': api_key,
-            'User-Agent': 'OSINT Research Hub'
+            'hibp-api-key': api_key
         }
         
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"https://haveibeenpwned.com/api/v3/breachedaccount/{email}",
                 headers=headers
             )
@@ -243,8 +696,10 @@ class OSINTHub:
                     results.append(f"Date: {breach['BreachDate']}")
                     results.append(f"Description: {breach['Description']}")
                     results.append(f"Compromised Data: {', '.join(breach['DataClasses'])}")
+                self.cache.set(key, "\n".join(results))
             elif response.status_code == 404:
                 results.append("No breaches found")
+                self.cache.set(key, "\n".join(results), NEGATIVE_CACHE_TTL)
             else:
                 results.append(f"Error: {response.status_code}")
                 
@@ -258,34 +713,19 @@ class OSINTHub:
         results = []
         
         try:
-            # Parse phone number
-            parsed = phonenumbers.parse(phone_number)
+            # Parse phone number (memoized, so repeat searches skip the lookups)
+            valid, country, carrier_name, tz, type_name = _phone_details(phone_number)
             
             results.append("=== Phone Number Analysis ===")
-            results.append(f"Valid: {phonenumbers.is_valid_number(parsed)}")
-            results.append(f"Country: {geocoder.description_for_number(parsed, 'en')}")
-            results.append(f"Carrier: {carrier.name_for_number(parsed, 'en')}")
+            results.append(f"Valid: {valid}")
+            results.append(f"Country: {country}")
+            results.append(f"Carrier: {carrier_name}")
             
             # Get possible timezones
-            tz = timezone.time_zones_for_number(parsed)
             results.append(f"Possible Timezones: {', '.join(tz)}")
             
             # Number type
-            number_type = phonenumbers.number_type(parsed)
-            type_map = {
-                phonenumbers.PhoneNumberType.MOBILE: "Mobile",
-                phonenumbers.PhoneNumberType.FIXED_LINE: "Fixed Line",
-                phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: "Fixed Line or Mobile",
-                phonenumbers.PhoneNumberType.TOLL_FREE: "Toll Free",
-                phonenumbers.PhoneNumberType.PREMIUM_RATE: "Premium Rate",
-                phonenumbers.PhoneNumberType.SHARED_COST: "Shared Cost",
-                phonenumbers.PhoneNumberType.VOIP: "VoIP",
-                phonenumbers.PhoneNumberType.PERSONAL_NUMBER: "Personal Number",
-                phonenumbers.PhoneNumberType.PAGER: "Pager",
-                phonenumbers.PhoneNumberType.UAN: "UAN",
-                phonenumbers.PhoneNumberType.UNKNOWN: "Unknown"
-            }
-            results.append(f"Number Type: {type_map.get(number_type, 'Unknown')}")
+            results.append(f"Number Type: {type_name}")
             
         except Exception as e:
             results.append(f"Error in phone analysis: {str(e)}")
@@ -293,40 +733,47 @@ class OSINTHub:
         return "\n".join(results)
         
     def create_visualizations(self):
-        """Create visualizations based on collected data"""
-        self.fig.clear()
-        
-        if not self.results:
+        """Update the visualizations with the collected data"""
+        if not self._timestamps and 'data_sources' not in self.results:
             return
             
-        # Create subplots
-        axs = self.fig.subplots(2, 1)
+        ax_line, ax_bar = self.axs
+        full_redraw = self._background is None
         
         # Top plot: API Response Timeline
-        timestamps = []
-        response_times = []
-        
-        for result in self.results.get('api_responses', []):
-            timestamps.append(result['timestamp'])
-            response_times.append(result['response_time'])
-            
-        if timestamps and response_times:
-            axs[0].plot(timestamps, response_times, 'bo-')
-            axs[0].set_title('API Response Times')
-            axs[0].set_xlabel('Time')
-            axs[0].set_ylabel('Response Time (s)')
-            axs[0].tick_params(axis='x', rotation=45)
+        self._line.set_data(list(self._timestamps), list(self._response_times))
+        limits = (ax_line.get_xlim(), ax_line.get_ylim())
+        ax_line.relim()
+        ax_line.autoscale_view()
+        if (ax_line.get_xlim(), ax_line.get_ylim()) != limits:
+            full_redraw = True  # ticks changed, so the saved background is stale
             
         # Bottom plot: Data Sources Distribution
-        if 'data_sources' in self.results:
-            sources = list(self.results['data_sources'].keys())
-            values = list(self.results['data_sources'].values())
+        data_sources = self.results.get('data_sources', {})
+        sources = list(data_sources.keys())
+        values = list(data_sources.values())
+        if sources != self._bar_sources:
+            # A new source appeared: rebuild the bars
+            if self._bars is not None:
+                self._bars.remove()
+            self._bars = ax_bar.bar(sources, values, color='C0')
+            self._bar_sources = sources
+            full_redraw = True
+        else:
+            for bar, value in zip(self._bars, values):
+                if bar.get_height() != value:
+                    bar.set_height(value)
+                    full_redraw = True
+        if full_redraw:
+            ax_bar.relim()
+            ax_bar.autoscale_view()
             
-            axs[1].bar(sources, values)
-            axs[1].set_title('Data Sources Distribution')
-            axs[1].set_xlabel('Source')
-            axs[1].set_ylabel('Number of Results')
-            axs[1].tick_params(axis='x', rotation=45)
-            
-        self.fig.tight_layout()
-        self.canvas.draw()
\ No newline at end of file
+        if full_redraw:
+            # Redraws everything; _on_draw then saves the background and adds the line
+            self.fig.tight_layout()
+            self.canvas.draw()
+        else:
+            # Only the line changed: blit it onto the saved background
+            self.canvas.restore_region(self._background)
+            ax_line.draw_artist(self._line)
+            self.canvas.blit(ax_line.bbox)
@@ -0,0 +1,212 @@
+import os
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import migrate_hdd
+
+
+class FastCopyTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_syscall_reporting_eof_at_once_falls_back(self):
+        # procfs/sysfs and some FUSE/NFS mounts return 0 from the first call
+        src = self.tmp / "src.bin"
+        src.write_bytes(os.urandom(5000))
+        dst = self.tmp / "dst.bin"
+        with mock.patch.object(os, "copy_file_range", return_value=0, create=True), \
+                mock.patch.object(os, "sendfile", return_value=0, create=True):
+            migrate_hdd._fast_copy(src, dst)
+        self.assertEqual(dst.read_bytes(), src.read_bytes())
+
+    def test_native_and_python_copies_follow_symlinks_alike(self):
+        outside = self.tmp / "outside"
+        outside.mkdir()
+        (outside / "file.txt").write_text("linked")
+        src = self.tmp / "tree"
+        src.mkdir()
+        (src / "link").symlink_to(outside, target_is_directory=True)
+        for name in "abc":
+            (src / name).write_text(name)
+
+        migrate_hdd._fast_copytree(src, self.tmp / "python")
+        with mock.patch.object(migrate_hdd, "NATIVE_COPY_MIN_ENTRIES", 1):
+            self.assertTrue(migrate_hdd._native_copytree(src, self.tmp / "native"))
+
+        for copy in ("python", "native"):
+            link = self.tmp / copy / "link"
+            self.assertFalse(link.is_symlink(), copy)
+            self.assertEqual((link / "file.txt").read_text(), "linked")
+
+class ArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_symlinked_source_is_archived_with_its_data(self):
+        real = self.tmp / "real"
+        real.mkdir()
+        (real / "file.txt").write_text("data")
+        source = self.tmp / "data"
+        source.symlink_to(real, target_is_directory=True)
+        backup_dir = self.tmp / "backup"
+        backup_dir.mkdir()
+
+        with mock.patch.object(migrate_hdd, "zstandard", None):
+            archive_path = migrate_hdd._archive_sources([source], backup_dir)
+
+        with tarfile.open(archive_path) as tar:
+            self.assertTrue(tar.getmember("data").isdir())
+            self.assertEqual(tar.extractfile("data/file.txt").read(), b"data")
+
+
+class CleanUpTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_symlinked_source_keeps_migrated_copy(self):
+        # After create_symlinks the source is a link to the migrated copy
+        migrated = self.tmp / "target" / "data"
+        migrated.mkdir(parents=True)
+        (migrated / "file.txt").write_text("keep me")
+        source = self.tmp / "data"
+        source.symlink_to(migrated, target_is_directory=True)
+
+        migrate_hdd.clean_up([source])
+
+        self.assertFalse(os.path.lexists(source))
+        self.assertEqual((migrated / "file.txt").read_text(), "keep me")
+
+    def test_removes_directory_tree(self):
+        source = self.tmp / "data"
+        (source / "sub").mkdir(parents=True)
+        (source / "sub" / "file.txt").write_text("x")
+        outside = self.tmp / "outside"
+        outside.mkdir()
+        (outside / "file.txt").write_text("keep me")
+        (source / "link").symlink_to(outside, target_is_directory=True)
+
+        migrate_hdd.clean_up([source])
+
+        self.assertFalse(os.path.lexists(source))
+        self.assertEqual((outside / "file.txt").read_text(), "keep me")
+
+    def test_fast_rmtree_refuses_symlink(self):
+        real = self.tmp / "real"
+        real.mkdir()
+        (real / "file.txt").write_text("keep me")
+        link = self.tmp / "link"
+        link.symlink_to(real, target_is_directory=True)
+
+        with self.assertRaises(OSError):
+            migrate_hdd._fast_rmtree(link)
+        self.assertTrue((real / "file.txt").exists())
+
+
+class MigrateFilesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_symlinked_source_is_copied_not_renamed(self):
+        real = self.tmp / "real"
+        real.mkdir()
+        (real / "file.txt").write_text("data")
+        source = self.tmp / "data"
+        source.symlink_to(real, target_is_directory=True)
+        target = self.tmp / "target"
+        moved = set()
+
+        migrate_hdd.migrate_files([source], target, migrate_hdd._stat_sources([source]), moved)
+
+        self.assertEqual(moved, set())
+        migrated = target / "data"
+        self.assertFalse(migrated.is_symlink())
+        self.assertEqual((migrated / "file.txt").read_text(), "data")
+        self.assertTrue(source.is_symlink())
+
+    def test_same_device_source_is_renamed(self):
+        source = self.tmp / "data"
+        source.mkdir()
+        (source / "file.txt").write_text("data")
+        target = self.tmp / "target"
+        moved = set()
+
+        migrate_hdd.migrate_files([source], target, migrate_hdd._stat_sources([source]), moved)
+
+        self.assertEqual(moved, {source})
+        self.assertFalse(os.path.lexists(source))
+        self.assertEqual((target / "data" / "file.txt").read_text(), "data")
+
+    def test_failed_copy_leaves_sources_in_place(self):
+        renamable = self.tmp / "data"
+        renamable.mkdir()
+        (renamable / "file.txt").write_text("data")
+        real = self.tmp / "real"
+        real.mkdir()
+        linked = self.tmp / "linked"
+        linked.symlink_to(real, target_is_directory=True)
+        target = self.tmp / "target"
+        sources = [renamable, linked]
+
+        with mock.patch.object(migrate_hdd, "_copy_one", side_effect=OSError("disk full")), \
+                self.assertRaises(SystemExit):
+            migrate_hdd.migrate_files(sources, target, migrate_hdd._stat_sources(sources), set())
+
+        self.assertEqual((renamable / "file.txt").read_text(), "data")
+        self.assertFalse(os.path.lexists(target / "data"))
+
+    def test_same_named_sources_are_refused(self):
+        first = self.tmp / "a" / "data"
+        second = self.tmp / "b" / "data"
+        for source in (first, second):
+            source.mkdir(parents=True)
+            (source / "file.txt").write_text(str(source))
+        target = self.tmp / "target"
+        sources = [first, second]
+
+        with self.assertRaises(SystemExit):
+            migrate_hdd.migrate_files(sources, target, migrate_hdd._stat_sources(sources), set())
+
+        self.assertEqual((first / "file.txt").read_text(), str(first))
+        self.assertEqual((second / "file.txt").read_text(), str(second))
+        self.assertFalse(os.path.lexists(target / "data"))
+
+    def test_existing_destination_is_refused(self):
+        source = self.tmp / "data"
+        source.mkdir()
+        (source / "file.txt").write_text("new")
+        existing = self.tmp / "target" / "data"
+        existing.mkdir(parents=True)
+        (existing / "other.txt").write_text("old")
+
+        with self.assertRaises(SystemExit):
+            migrate_hdd.migrate_files([source], self.tmp / "target",
+                                      migrate_hdd._stat_sources([source]), set())
+
+        self.assertEqual(os.listdir(existing), ["other.txt"])
+        self.assertEqual((source / "file.txt").read_text(), "new")
+
+
+if __name__ == "__main__":
+    unittest.main()